@@ -1,7 +1,7 @@
 """consolidate notes to full jsonb and add tags and collections
 
 Revision ID: 17db4e32f774
-Revises: d549dbc882b3
+Revises: 9e3b7d20c6f1
 Create Date: 2025-11-14 16:10:07.313665
 
 """
@@ -13,7 +13,7 @@ from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = '17db4e32f774'
-down_revision: Union[str, Sequence[str], None] = 'd549dbc882b3'
+down_revision: Union[str, Sequence[str], None] = '9e3b7d20c6f1'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
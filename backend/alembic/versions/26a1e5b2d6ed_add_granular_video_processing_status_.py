@@ -20,11 +20,18 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema - add granular processing status states."""
-    # Add new enum values to videostatus enum type
-    op.execute("ALTER TYPE videostatus ADD VALUE IF NOT EXISTS 'downloading'")
-    op.execute("ALTER TYPE videostatus ADD VALUE IF NOT EXISTS 'extracting_audio'")
-    op.execute("ALTER TYPE videostatus ADD VALUE IF NOT EXISTS 'transcribing'")
-    op.execute("ALTER TYPE videostatus ADD VALUE IF NOT EXISTS 'generating_notes'")
+    # Add new enum values to videostatus enum type in a single DO block,
+    # sent as one statement instead of four (PostgreSQL 12+)
+    op.execute("""
+        DO $$
+        BEGIN
+            ALTER TYPE videostatus ADD VALUE IF NOT EXISTS 'downloading';
+            ALTER TYPE videostatus ADD VALUE IF NOT EXISTS 'extracting_audio';
+            ALTER TYPE videostatus ADD VALUE IF NOT EXISTS 'transcribing';
+            ALTER TYPE videostatus ADD VALUE IF NOT EXISTS 'generating_notes';
+        END
+        $$;
+    """)
 
 
 def downgrade() -> None:
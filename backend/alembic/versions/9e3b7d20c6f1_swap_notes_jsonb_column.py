@@ -0,0 +1,37 @@
+"""swap notes jsonb column
+
+Revision ID: 9e3b7d20c6f1
+Revises: d549dbc882b3
+Create Date: 2025-11-12 21:18:10.592047
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3b7d20c6f1'
+down_revision: Union[str, Sequence[str], None] = 'd549dbc882b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Catch rows written to the text column since the backfill, then swap
+    # the columns; this is a short metadata-only transaction
+    op.execute(
+        "UPDATE transcriptions SET notes_jsonb = notes::jsonb "
+        "WHERE notes IS NOT NULL AND notes_jsonb IS NULL"
+    )
+    op.drop_column('transcriptions', 'notes')
+    op.alter_column('transcriptions', 'notes_jsonb', new_column_name='notes')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('transcriptions', 'notes', new_column_name='notes_jsonb')
+    op.add_column('transcriptions', sa.Column('notes', sa.Text(), nullable=True))
+    op.execute("UPDATE transcriptions SET notes = notes_jsonb::text WHERE notes_jsonb IS NOT NULL")
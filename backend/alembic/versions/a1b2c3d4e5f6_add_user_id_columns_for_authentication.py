@@ -19,26 +19,25 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add user_id column to videos table
-    op.add_column('videos', sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True))
-    op.create_index('ix_videos_user_id', 'videos', ['user_id'], unique=False)
+    # Add user_id column to videos, collections, and tags tables, one batch per table
+    for table in ('videos', 'collections', 'tags'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True))
 
-    # Add user_id column to collections table
-    op.add_column('collections', sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True))
-    op.create_index('ix_collections_user_id', 'collections', ['user_id'], unique=False)
-
-    # Add user_id column to tags table
-    op.add_column('tags', sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True))
-    op.create_index('ix_tags_user_id', 'tags', ['user_id'], unique=False)
+    # Build indexes without blocking writers (CONCURRENTLY cannot run in a transaction)
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_user_id ON videos (user_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_collections_user_id ON collections (user_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tags_user_id ON tags (user_id)")
 
 
 def downgrade() -> None:
     # Remove user_id columns and indexes
-    op.drop_index('ix_tags_user_id', table_name='tags')
-    op.drop_column('tags', 'user_id')
-
-    op.drop_index('ix_collections_user_id', table_name='collections')
-    op.drop_column('collections', 'user_id')
-
-    op.drop_index('ix_videos_user_id', table_name='videos')
-    op.drop_column('videos', 'user_id')
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tags_user_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_collections_user_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_videos_user_id")
+
+    for table in ('tags', 'collections', 'videos'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('user_id')
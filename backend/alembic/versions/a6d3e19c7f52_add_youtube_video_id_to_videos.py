@@ -0,0 +1,29 @@
+"""add youtube_video_id to videos
+
+Revision ID: a6d3e19c7f52
+Revises: f4c27a9e8b15
+Create Date: 2025-11-28 15:42:10.537219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d3e19c7f52'
+down_revision: Union[str, Sequence[str], None] = 'f4c27a9e8b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable, no default: metadata-only change. Existing rows fall back to parsing youtube_url.
+    op.add_column('videos', sa.Column('youtube_video_id', sa.String(length=11), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('videos', 'youtube_video_id')
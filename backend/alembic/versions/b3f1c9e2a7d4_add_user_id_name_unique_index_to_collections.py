@@ -0,0 +1,35 @@
+"""add user_id + name unique index to collections
+
+Revision ID: b3f1c9e2a7d4
+Revises: 26a1e5b2d6ed
+Create Date: 2025-11-26 09:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c9e2a7d4'
+down_revision: Union[str, Sequence[str], None] = '26a1e5b2d6ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Collection names are unique per user, not globally
+    op.create_index('ix_collections_user_id_name', 'collections', ['user_id', 'name'], unique=True)
+    op.drop_constraint('collections_name_key', 'collections', type_='unique')
+
+    # Leftmost prefix of the compound index serves user_id lookups
+    op.drop_index('ix_collections_user_id', table_name='collections')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_collections_user_id', 'collections', ['user_id'], unique=False)
+    op.create_unique_constraint('collections_name_key', 'collections', ['name'])
+    op.drop_index('ix_collections_user_id_name', table_name='collections')
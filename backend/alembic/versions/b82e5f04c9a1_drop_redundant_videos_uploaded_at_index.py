@@ -0,0 +1,31 @@
+"""drop redundant videos uploaded_at index
+
+Revision ID: b82e5f04c9a1
+Revises: a6d3e19c7f52
+Create Date: 2025-11-29 10:18:52.904736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b82e5f04c9a1'
+down_revision: Union[str, Sequence[str], None] = 'a6d3e19c7f52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Every uploaded_at ordering is per user and served by ix_videos_user_id_uploaded_at_active
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_videos_uploaded_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_uploaded_at ON videos (uploaded_at)")
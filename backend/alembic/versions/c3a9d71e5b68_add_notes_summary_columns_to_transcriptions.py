@@ -0,0 +1,79 @@
+"""add notes summary columns and gin index to transcriptions
+
+Revision ID: c3a9d71e5b68
+Revises: b82e5f04c9a1
+Create Date: 2025-11-29 13:46:05.217384
+
+"""
+import time
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9d71e5b68'
+down_revision: Union[str, Sequence[str], None] = 'b82e5f04c9a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNT_COLUMNS = ('key_points', 'takeaways', 'tags', 'quotes')
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _array_length(key: str) -> str:
+    return (
+        f"CASE WHEN jsonb_typeof(notes->'{key}') = 'array' "
+        f"THEN jsonb_array_length(notes->'{key}') ELSE 0 END"
+    )
+
+
+def _backfill_notes_columns() -> None:
+    """Copy summary and list counts out of existing notes in autocommitted batches."""
+    conn = op.get_bind()
+    assignments = ", ".join(
+        [f"{key}_count = {_array_length(key)}" for key in COUNT_COLUMNS]
+        + ["note_summary = notes->>'summary'"]
+    )
+    stmt = sa.text(
+        f"UPDATE transcriptions SET {assignments} "
+        f"WHERE id IN ("
+        f"SELECT id FROM transcriptions WHERE notes IS NOT NULL AND key_points_count IS NULL "
+        f"LIMIT :batch_size FOR UPDATE SKIP LOCKED)"
+    )
+
+    with op.get_context().autocommit_block():
+        while True:
+            result = conn.execute(stmt, {"batch_size": BACKFILL_BATCH_SIZE})
+            if result.rowcount == 0:
+                break
+            time.sleep(0.05)  # Give autovacuum room between batches
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Narrow columns let list_videos skip detoasting the notes blob
+    op.add_column('transcriptions', sa.Column('note_summary', sa.Text(), nullable=True))
+    for key in COUNT_COLUMNS:
+        op.add_column('transcriptions', sa.Column(f'{key}_count', sa.SmallInteger(), nullable=True))
+
+    _backfill_notes_columns()
+
+    # Containment (@>) filters on notes
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transcriptions_notes_gin "
+            "ON transcriptions USING gin (notes jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transcriptions_notes_gin")
+
+    for key in reversed(COUNT_COLUMNS):
+        op.drop_column('transcriptions', f'{key}_count')
+    op.drop_column('transcriptions', 'note_summary')
@@ -0,0 +1,74 @@
+"""make user_id not null on videos and collections
+
+Revision ID: c7e4a1d95b02
+Revises: b3f1c9e2a7d4
+Create Date: 2025-11-26 14:03:27.906115
+
+"""
+import time
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e4a1d95b02'
+down_revision: Union[str, Sequence[str], None] = 'b3f1c9e2a7d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Owner assigned to legacy rows created before authentication existed.
+# Use scripts/assign_existing_data_to_user.py beforehand to give them a real owner.
+SYSTEM_USER_ID = '00000000-0000-0000-0000-000000000000'
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _backfill_user_id(table: str) -> None:
+    """Assign orphaned rows to the system user in small autocommitted batches.
+
+    Each batch commits on its own so row locks are short-lived, and
+    SKIP LOCKED lets live traffic touch the same table concurrently.
+    """
+    conn = op.get_bind()
+    stmt = sa.text(
+        f"UPDATE {table} SET user_id = :user_id "
+        f"WHERE id IN ("
+        f"SELECT id FROM {table} WHERE user_id IS NULL "
+        f"LIMIT :batch_size FOR UPDATE SKIP LOCKED)"
+    )
+
+    with op.get_context().autocommit_block():
+        while True:
+            result = conn.execute(stmt, {"user_id": SYSTEM_USER_ID, "batch_size": BACKFILL_BATCH_SIZE})
+            if result.rowcount == 0:
+                break
+            time.sleep(0.05)  # Give autovacuum room between batches
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Backfill orphaned rows, then enforce ownership at the schema level.
+    # Tags stay nullable: note generation creates them without an owner.
+    # No foreign key is added since users live in Supabase, not this database.
+    for table in ('videos', 'collections'):
+        _backfill_user_id(table)
+        op.alter_column(
+            table,
+            'user_id',
+            existing_type=postgresql.UUID(as_uuid=True),
+            nullable=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('collections', 'videos'):
+        op.alter_column(
+            table,
+            'user_id',
+            existing_type=postgresql.UUID(as_uuid=True),
+            nullable=True
+        )
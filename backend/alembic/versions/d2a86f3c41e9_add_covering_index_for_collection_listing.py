@@ -0,0 +1,45 @@
+"""add covering index for collection listing
+
+Revision ID: d2a86f3c41e9
+Revises: c7e4a1d95b02
+Create Date: 2025-11-27 10:41:52.337810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a86f3c41e9'
+down_revision: Union[str, Sequence[str], None] = 'c7e4a1d95b02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Replace the (user_id, name) unique index with one that also carries id.
+    # description stays out: unbounded text can exceed the btree tuple limit.
+    # Built without blocking writers (CONCURRENTLY cannot run in a transaction)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_collections_user_id_name_inc "
+            "ON collections (user_id, name) INCLUDE (id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_collections_user_id_name")
+
+    # Keep the visibility map current so index-only scans skip the heap
+    op.execute("ALTER TABLE collections SET (autovacuum_vacuum_scale_factor = 0.05)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE collections RESET (autovacuum_vacuum_scale_factor)")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_collections_user_id_name "
+            "ON collections (user_id, name)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_collections_user_id_name_inc")
@@ -5,6 +5,7 @@ Revises: 6478b532d83d
 Create Date: 2025-11-12 21:05:44.749666
 
 """
+import time
 from typing import Sequence, Union
 
 from alembic import op
@@ -17,14 +18,33 @@ down_revision: Union[str, Sequence[str], None] = '6478b532d83d'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+BACKFILL_BATCH_SIZE = 1000
+
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Convert text column to JSONB using explicit cast
-    op.execute('ALTER TABLE transcriptions ALTER COLUMN notes TYPE JSONB USING notes::jsonb')
+    # Add a JSONB shadow column and backfill it in batches instead of casting
+    # in place, which would rewrite the table under an ACCESS EXCLUSIVE lock.
+    # The swap happens in the follow-up revision 9e3b7d20c6f1.
+    op.add_column('transcriptions', sa.Column('notes_jsonb', postgresql.JSONB(), nullable=True))
+
+    conn = op.get_bind()
+    stmt = sa.text(
+        "UPDATE transcriptions SET notes_jsonb = notes::jsonb "
+        "WHERE id IN ("
+        "SELECT id FROM transcriptions "
+        "WHERE notes IS NOT NULL AND notes_jsonb IS NULL "
+        "LIMIT :batch_size FOR UPDATE SKIP LOCKED)"
+    )
+
+    with op.get_context().autocommit_block():
+        while True:
+            result = conn.execute(stmt, {"batch_size": BACKFILL_BATCH_SIZE})
+            if result.rowcount == 0:
+                break
+            time.sleep(0.05)  # Give autovacuum room between batches
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    # Convert JSONB column back to text
-    op.execute('ALTER TABLE transcriptions ALTER COLUMN notes TYPE TEXT')
+    op.drop_column('transcriptions', 'notes_jsonb')
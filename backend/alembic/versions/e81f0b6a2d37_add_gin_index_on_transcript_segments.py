@@ -0,0 +1,36 @@
+"""add gin index on transcript_segments
+
+Revision ID: e81f0b6a2d37
+Revises: d2a86f3c41e9
+Create Date: 2025-11-27 16:25:08.144952
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81f0b6a2d37'
+down_revision: Union[str, Sequence[str], None] = 'd2a86f3c41e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # jsonb_path_ops only supports containment (@>) but is smaller and
+    # faster than the default opclass. CONCURRENTLY cannot run inside a
+    # transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transcriptions_segments_gin "
+            "ON transcriptions USING GIN (transcript_segments jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transcriptions_segments_gin")
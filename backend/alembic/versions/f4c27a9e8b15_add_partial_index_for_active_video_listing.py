@@ -0,0 +1,34 @@
+"""add partial index for active video listing
+
+Revision ID: f4c27a9e8b15
+Revises: e81f0b6a2d37
+Create Date: 2025-11-28 11:07:36.281944
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c27a9e8b15'
+down_revision: Union[str, Sequence[str], None] = 'e81f0b6a2d37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches list_videos: WHERE user_id = ? AND deleted_at IS NULL ORDER BY uploaded_at DESC
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_user_id_uploaded_at_active "
+            "ON videos (user_id, uploaded_at DESC) WHERE deleted_at IS NULL"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_videos_user_id_uploaded_at_active")
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert
 from typing import List
 from uuid import UUID
 from loguru import logger
@@ -27,19 +29,56 @@ class CollectionResponse(BaseModel):
         from_attributes = True
 
 
+def _list_collections_stmt(user_id: str, after_name: str | None, limit: int | None):
+    """
+    Build the list query as a lambda statement.
+
+    Closure variables become bound parameters, so SQL compilation is cached
+    per shape (with/without cursor, with/without limit) instead of per request.
+    """
+    # Select only the response columns to skip ORM object hydration
+    stmt = lambda_stmt(
+        lambda: select(Collection.id, Collection.name, Collection.description)
+        .filter(Collection.user_id == user_id)
+        .order_by(Collection.name)
+    )
+    if after_name is not None:
+        stmt += lambda s: s.filter(Collection.name > after_name)
+    if limit is not None:
+        stmt += lambda s: s.limit(limit)
+    return stmt
+
+
 @router.get("", response_model=List[CollectionResponse])
 async def list_collections(
+    after_name: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=500),
     db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_current_user)
 ):
-    """Get all collections for the current user."""
-    result = await db.execute(
-        select(Collection)
-        .filter(Collection.user_id == user_id)
-        .order_by(Collection.name)
+    """
+    Get all collections for the current user, ordered by name.
+
+    Supports keyset pagination: pass the last name seen as `after_name`
+    together with `limit`. Names are unique per user, so name alone is a
+    stable cursor. Rows are streamed as a JSON array to keep memory bounded.
+    """
+    result = await db.stream(
+        _list_collections_stmt(user_id, after_name, limit),
+        execution_options={"yield_per": 100}
     )
-    collections = result.scalars().all()
-    return collections
+
+    async def generate_json_array():
+        yield "["
+        first = True
+        async for row in result:
+            if not first:
+                yield ","
+            first = False
+            yield CollectionResponse.model_construct(**row._mapping).model_dump_json()
+        yield "]"
+
+    return StreamingResponse(generate_json_array(), media_type="application/json")
 
 
 @router.post("", response_model=CollectionResponse, status_code=201)
@@ -49,33 +88,30 @@ async def create_collection(
     user_id: str = Depends(get_current_user)
 ):
     """Create a new collection."""
-    # Check if collection with same name already exists for this user
+    # Duplicate names are resolved server-side against the (user_id, name) unique index
     result = await db.execute(
-        select(Collection).filter(
-            Collection.name == collection.name,
-            Collection.user_id == user_id
+        insert(Collection)
+        .values(
+            name=collection.name,
+            description=collection.description,
+            user_id=user_id
         )
+        .on_conflict_do_nothing(index_elements=["user_id", "name"])
+        .returning(Collection.id, Collection.name, Collection.description)
     )
-    existing = result.scalar_one_or_none()
+    row = result.first()
 
-    if existing:
+    # INSERT ... RETURNING carries the row back; no refresh SELECT after commit
+    if row is None:
         raise HTTPException(
             status_code=400,
             detail=f"Collection '{collection.name}' already exists"
         )
 
-    # Create new collection with user_id
-    new_collection = Collection(
-        name=collection.name,
-        description=collection.description,
-        user_id=user_id
-    )
-    db.add(new_collection)
     await db.commit()
-    await db.refresh(new_collection)
 
-    logger.info(f"Created collection: {new_collection.name} ({new_collection.id})")
-    return new_collection
+    logger.info(f"Created collection: {row.name} ({row.id})")
+    return CollectionResponse.model_construct(**row._mapping)
 
 
 @router.delete("/{collection_id}", status_code=204)
@@ -85,18 +121,19 @@ async def delete_collection(
     user_id: str = Depends(get_current_user)
 ):
     """Delete a collection."""
-    result = await db.execute(
-        select(Collection).filter(
+    # Single round-trip: ownership check and delete in one statement
+    name = await db.scalar(
+        delete(Collection)
+        .where(
             Collection.id == collection_id,
             Collection.user_id == user_id
         )
+        .returning(Collection.name)
     )
-    collection = result.scalar_one_or_none()
 
-    if not collection:
+    if name is None:
         raise HTTPException(status_code=404, detail="Collection not found")
 
-    await db.delete(collection)
     await db.commit()
 
-    logger.info(f"Deleted collection: {collection.name} ({collection_id})")
+    logger.info(f"Deleted collection: {name} ({collection_id})")
@@ -1,13 +1,14 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection
+from sqlalchemy import select, update, func
+import asyncio
 from uuid import UUID
 import uuid
 
-from app.database import get_db
+from app.database import get_db, get_read_conn
 from app.dependencies.auth import get_current_user
-from app.models import Video, Transcription, VideoStatus, SourceType, HlsStatus
+from app.models import Video, Transcription, VideoStatus, SourceType
 from app.schemas import (
     VideoUploadResponse,
     VideoStatusResponse,
@@ -24,22 +25,18 @@ from app.schemas import (
     PresignedUploadResponse,
     UploadCompleteRequest,
 )
-from app.utils.file_handler import validate_video_file, save_upload_file, save_upload_to_r2, delete_file
 from app.services.r2_service import (
+    abort_multipart_upload,
+    complete_multipart_upload,
+    create_presigned_multipart_upload,
     delete_video,
     generate_presigned_upload_url,
+    get_stream_url,
     verify_r2_object_exists,
     R2Error
 )
-from app.services.hls_service import (
-    generate_hls_for_video,
-    get_hls_playlist_url,
-    delete_hls_directory,
-    HlsGenerationError
-)
-from app.services.youtube_service import extract_video_id
-from app.utils.file_handler import delete_file
-from datetime import datetime
+from app.services.hls_service import delete_hls_directory
+from app.services.youtube_service import extract_video_id, YouTubeDownloadError
 from app.config import settings
 from loguru import logger
 
@@ -53,59 +50,20 @@ if not settings.gcp_project_id or not settings.worker_service_url:
 router = APIRouter(prefix="/api/videos", tags=["videos"])
 
 
-@router.post("/upload", response_model=VideoUploadResponse, status_code=201)
-async def upload_video(
-    file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
-    user_id: str = Depends(get_current_user)
-):
-    """Upload a video file and initiate compression/upload process."""
-    # Validate file
-    validate_video_file(file)
-
-    # Save to temp file
-    temp_path, original_size = await save_upload_file(file)
-    logger.info(f"Video saved to temp: {temp_path} ({original_size / (1024*1024):.2f}MB)")
-
-    # Upload to R2 immediately (uncompressed)
-    r2_key, file_size = upload_local_file(temp_path, user_id=user_id)
-    logger.info(f"Video uploaded to R2: {r2_key}")
-
-    # Create database record
-    video = Video(
-        filename=file.filename,
-        file_path=r2_key,
-        r2_key=r2_key,
-        file_size=file_size,
-        status=VideoStatus.uploading,
-        source_type=SourceType.upload,
-        user_id=user_id
-    )
-    db.add(video)
-    await db.commit()
-    await db.refresh(video)
-
-    logger.info(f"Video {video.id} created, queuing processing task")
-
-    # Queue processing task via Cloud Tasks
-    try:
-        create_video_processing_task(str(video.id), r2_key, user_id)
-        logger.info(f"Created Cloud Task for video {video.id}")
-    except CloudTasksError as e:
-        logger.error(f"Cloud Task creation failed: {str(e)}")
-        # Update video status to failed
-        video.status = VideoStatus.failed
-        await db.commit()
-        raise HTTPException(status_code=500, detail=f"Failed to queue video processing: {str(e)}")
-
-    # Clean up temp file
-    delete_file(temp_path)
+@router.post("/upload", deprecated=True, include_in_schema=False)
+async def upload_video():
+    """
+    Removed server-proxied upload.
 
-    return VideoUploadResponse(
-        id=video.id,
-        filename=video.filename,
-        status=video.status,
-        status_url=f"/api/videos/{video.id}/status"
+    Proxying video bytes through the API doubled the data path and tied up a
+    worker for the whole transfer. Clients upload directly to R2 via
+    /upload/presigned followed by /{video_id}/upload/complete. No parameters
+    are declared so the request body is never parsed.
+    """
+    raise HTTPException(
+        status_code=410,
+        detail="Direct uploads are no longer supported. Use POST /api/videos/upload/presigned.",
+        headers={"Link": '</api/videos/upload/presigned>; rel="alternate"'}
     )
 
 
@@ -121,6 +79,10 @@ async def generate_presigned_upload(
     This endpoint creates a video record and returns a presigned URL that
     the frontend can use to upload directly to R2, bypassing the API.
     After upload, the frontend must call /upload/complete to trigger processing.
+
+    With multipart=true, files above the multipart threshold get an upload_id
+    and one presigned URL per part instead; the frontend uploads parts in
+    parallel and sends upload_id plus each part's ETag to /upload/complete.
     """
     try:
         # Generate unique R2 key
@@ -131,12 +93,23 @@ async def generate_presigned_upload(
 
         logger.info(f"Generating presigned upload URL for {request.filename} ({request.file_size / (1024*1024):.2f}MB)")
 
-        # Generate presigned upload URL
-        upload_url = generate_presigned_upload_url(
-            r2_key,
-            content_type=request.content_type,
-            expires_in=settings.presigned_url_expiration_seconds
-        )
+        upload_url = upload_id = part_size = parts = None
+        if request.multipart and request.file_size > settings.r2_multipart_threshold_mb * 1024 * 1024:
+            # Large files: the client PUTs parts straight to R2 in parallel
+            upload_id, part_size, parts = await run_in_threadpool(
+                create_presigned_multipart_upload,
+                r2_key,
+                request.file_size,
+                content_type=request.content_type,
+                expires_in=settings.presigned_url_expiration_seconds
+            )
+        else:
+            # Generate presigned upload URL
+            upload_url = generate_presigned_upload_url(
+                r2_key,
+                content_type=request.content_type,
+                expires_in=settings.presigned_url_expiration_seconds
+            )
 
         # Create video record with uploading status
         video = Video(
@@ -150,7 +123,6 @@ async def generate_presigned_upload(
         )
         db.add(video)
         await db.commit()
-        await db.refresh(video)
 
         logger.info(f"Video {video.id} created with presigned URL (expires in {settings.presigned_url_expiration_seconds}s)")
 
@@ -159,7 +131,10 @@ async def generate_presigned_upload(
             upload_url=upload_url,
             r2_key=r2_key,
             expires_in=settings.presigned_url_expiration_seconds,
-            status_url=f"/api/videos/{video.id}/status"
+            status_url=f"/api/videos/{video.id}/status",
+            upload_id=upload_id,
+            part_size=part_size,
+            parts=parts
         )
 
     except Exception as e:
@@ -184,10 +159,9 @@ async def complete_upload(
     Called by frontend after successfully uploading to the presigned URL.
     """
     # Get video record
-    result = await db.execute(
+    video = await db.scalar(
         select(Video).filter(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
     )
-    video = result.scalar_one_or_none()
 
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
@@ -202,10 +176,23 @@ async def complete_upload(
         if not request.success:
             # Frontend reported upload failure
             logger.warning(f"Frontend reported upload failure for video {video_id}")
+            if request.upload_id:
+                # Release parts already stored for the abandoned upload
+                await run_in_threadpool(abort_multipart_upload, video.r2_key, request.upload_id)
             video.status = VideoStatus.failed
             await db.commit()
             raise HTTPException(status_code=400, detail="Upload failed")
 
+        if request.upload_id:
+            if not request.parts:
+                raise R2Error("Multipart upload completed without parts")
+            await run_in_threadpool(
+                complete_multipart_upload,
+                video.r2_key,
+                request.upload_id,
+                [part.model_dump() for part in request.parts]
+            )
+
         # Verify file exists in R2
         logger.info(f"Verifying R2 upload for video {video_id}: {video.r2_key}")
         verify_r2_object_exists(video.r2_key)
@@ -218,7 +205,7 @@ async def complete_upload(
 
         # Queue processing task via Cloud Tasks
         try:
-            create_video_processing_task(str(video.id), video.r2_key, user_id)
+            await create_video_processing_task(str(video.id), video.r2_key, user_id)
             logger.info(f"Created Cloud Task for video {video.id}")
         except CloudTasksError as e:
             logger.error(f"Cloud Task creation failed: {str(e)}")
@@ -265,6 +252,12 @@ async def submit_youtube_video(
     - https://youtu.be/VIDEO_ID
     - VIDEO_ID (11-character video identifier)
     """
+    # Reject unparseable URLs before any DB or queue work
+    try:
+        yt_video_id = extract_video_id(request.url)
+    except YouTubeDownloadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         logger.info(f"Processing YouTube video request: {request.url}")
 
@@ -277,11 +270,11 @@ async def submit_youtube_video(
             status=VideoStatus.uploading,
             source_type=SourceType.youtube,
             youtube_url=request.url,
+            youtube_video_id=yt_video_id,
             user_id=user_id
         )
         db.add(video)
         await db.commit()
-        await db.refresh(video)
 
         logger.info(f"YouTube video {video.id} created, queueing processing task")
 
@@ -289,7 +282,7 @@ async def submit_youtube_video(
         # Note: For YouTube videos, r2_key will be empty until download completes
         # Worker will need to handle YouTube download/upload before transcription
         try:
-            create_video_processing_task(str(video.id), "", user_id)
+            await create_video_processing_task(str(video.id), "", user_id)
             logger.info(f"Created Cloud Task for YouTube video {video.id}")
         except CloudTasksError as e:
             logger.error(f"Cloud Task creation failed: {str(e)}")
@@ -317,44 +310,53 @@ async def submit_youtube_video(
 @router.get("/{video_id}/status", response_model=VideoStatusResponse)
 async def get_video_status(
     video_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    conn: AsyncConnection = Depends(get_read_conn),
     user_id: str = Depends(get_current_user)
 ):
     """Check processing status of a video."""
-    result = await db.execute(
-        select(Video).filter(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
+    result = await conn.execute(
+        select(Video.id, Video.status, Video.uploaded_at, Video.duration_seconds, Video.title)
+        .filter(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
     )
-    video = result.scalar_one_or_none()
-    if not video:
+    row = result.first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    return VideoStatusResponse(
-        id=video.id,
-        status=video.status,
-        uploaded_at=video.uploaded_at,
-        duration_seconds=video.duration_seconds,
-        title=video.title
-    )
+    return VideoStatusResponse.model_construct(**row._mapping)
 
 
 @router.get("/{video_id}/transcription", response_model=TranscriptionResponse)
 async def get_transcription(
     video_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    conn: AsyncConnection = Depends(get_read_conn),
     user_id: str = Depends(get_current_user)
 ):
     """Retrieve completed transcription for a video."""
-    result = await db.execute(
-        select(Video).filter(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
+    # Ownership check and transcription fetch in one query
+    result = await conn.execute(
+        select(
+            Video.status,
+            Transcription.id.label("transcription_id"),
+            Transcription.video_id,
+            Transcription.transcript_text,
+            Transcription.transcript_segments,
+            Transcription.model_used,
+            Transcription.processing_time,
+            Transcription.created_at,
+            Transcription.error_message,
+            Transcription.audio_size,
+            Transcription.notes,
+        )
+        .outerjoin(Transcription, Transcription.video_id == Video.id)
+        .filter(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
     )
-    video = result.scalar_one_or_none()
-    if not video:
+    row = result.first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    result = await db.execute(select(Transcription).filter(Transcription.video_id == video_id))
-    transcription = result.scalar_one_or_none()
-
-    if not transcription:
+    if row.transcription_id is None:
         # Check if video is still being processed (any processing state)
         processing_states = [
             VideoStatus.uploading,
@@ -364,80 +366,72 @@ async def get_transcription(
             VideoStatus.transcribing,
             VideoStatus.generating_notes,
         ]
-        if video.status in processing_states:
+        if row.status in processing_states:
             raise HTTPException(status_code=404, detail="Transcription not ready yet")
         raise HTTPException(status_code=404, detail="Transcription not found")
 
-    if video.status == VideoStatus.failed:
+    if row.status == VideoStatus.failed:
         raise HTTPException(
             status_code=500,
-            detail=f"Transcription failed: {transcription.error_message}"
+            detail=f"Transcription failed: {row.error_message}"
         )
 
+    # Weak validator: changes when the transcription is recreated or notes regenerated
+    generated_at = row.notes.get("generated_at", "") if isinstance(row.notes, dict) else ""
+    etag = f'W/"{row.transcription_id}-{int(row.created_at.timestamp())}-{generated_at}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
     # Convert JSONB dict back to NotesData Pydantic object
     notes_object = None
-    if transcription.notes and isinstance(transcription.notes, dict):
-        notes_object = NotesData(**transcription.notes)
+    if row.notes and isinstance(row.notes, dict):
+        notes_object = NotesData(**row.notes)
 
     return TranscriptionResponse(
-        video_id=transcription.video_id,
-        transcript_text=transcription.transcript_text,
-        transcript_segments=transcription.transcript_segments,
-        model_used=transcription.model_used,
-        processing_time=transcription.processing_time,
-        created_at=transcription.created_at,
-        error_message=transcription.error_message,
-        audio_size=transcription.audio_size,
+        video_id=row.video_id,
+        transcript_text=row.transcript_text,
+        transcript_segments=row.transcript_segments,
+        model_used=row.model_used,
+        processing_time=row.processing_time,
+        created_at=row.created_at,
+        error_message=row.error_message,
+        audio_size=row.audio_size,
         notes=notes_object
     )
 
 
 @router.get("", response_model=VideoListResponse)
 async def list_videos(
-    db: AsyncSession = Depends(get_db),
+    conn: AsyncConnection = Depends(get_read_conn),
     user_id: str = Depends(get_current_user)
 ):
     """List all uploaded videos with note summaries for the current user."""
-    # Join videos with transcriptions to get note summaries, filter by user_id and exclude soft-deleted
-    result = await db.execute(
-        select(Video, Transcription)
+    # Join videos with transcriptions, filter by user_id and exclude soft-deleted.
+    # Summary and counts come from narrow columns written with the notes, so the
+    # notes blob is never read; plain column rows skip ORM identity-map bookkeeping.
+    result = await conn.execute(
+        select(
+            Video.id,
+            Video.filename,
+            Video.status,
+            Video.uploaded_at,
+            Transcription.note_summary,
+            Transcription.key_points_count,
+            Transcription.takeaways_count,
+            Transcription.tags_count,
+            Transcription.quotes_count,
+        )
         .outerjoin(Transcription, Video.id == Transcription.video_id)
         .filter(Video.user_id == user_id, Video.deleted_at.is_(None))
         .order_by(Video.uploaded_at.desc())
     )
-    rows = result.all()
-
-    videos_list = []
-    for video, transcription in rows:
-        note_summary = None
-        key_points_count = None
-        takeaways_count = None
-        tags_count = None
-        quotes_count = None
-
-        if transcription and transcription.notes:
-            # Handle both dict and string cases
-            notes_data = transcription.notes if isinstance(transcription.notes, dict) else None
-            if notes_data:
-                note_summary = notes_data.get('summary')
-                key_points_count = len(notes_data.get('key_points', []))
-                takeaways_count = len(notes_data.get('takeaways', []))
-                tags_count = len(notes_data.get('tags', []))
-                quotes_count = len(notes_data.get('quotes', []))
-
-        videos_list.append(VideoListItem(
-            id=video.id,
-            filename=video.filename,
-            status=video.status,
-            uploaded_at=video.uploaded_at,
-            note_summary=note_summary,
-            key_points_count=key_points_count,
-            takeaways_count=takeaways_count,
-            tags_count=tags_count,
-            quotes_count=quotes_count
-        ))
 
-    return VideoListResponse(videos=videos_list)
+    # Rows come straight from typed columns, so skip per-field validation
+    return VideoListResponse.model_construct(
+        videos=[VideoListItem.model_construct(**row._mapping) for row in result.all()]
+    )
 
 
 @router.patch("/{video_id}", response_model=VideoStatusResponse)
@@ -448,27 +442,21 @@ async def update_video(
     user_id: str = Depends(get_current_user)
 ):
     """Update video metadata (e.g., title)."""
-    result = await db.execute(
-        select(Video).filter(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
-    )
-    video = result.scalar_one_or_none()
-    if not video:
+    # Ownership check and update in one round-trip; COALESCE keeps the
+    # current title when none is provided
+    row = (await db.execute(
+        update(Video)
+        .where(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
+        .values(title=func.coalesce(update_data.title, Video.title))
+        .returning(Video.id, Video.status, Video.uploaded_at, Video.duration_seconds, Video.title)
+        .execution_options(synchronize_session=False)
+    )).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    # Update only provided fields
-    if update_data.title is not None:
-        video.title = update_data.title
-
     await db.commit()
-    await db.refresh(video)
-
-    return VideoStatusResponse(
-        id=video.id,
-        status=video.status,
-        uploaded_at=video.uploaded_at,
-        duration_seconds=video.duration_seconds,
-        title=video.title
-    )
+
+    return VideoStatusResponse.model_construct(**row._mapping)
 
 
 @router.get("/{video_id}/stream", response_model=VideoStreamResponse)
@@ -485,10 +473,9 @@ async def get_video_stream(
     Client should poll this endpoint when status is 'generating'.
     """
     # Validate user owns video and it's not deleted
-    result = await db.execute(
+    video = await db.scalar(
         select(Video).filter(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
     )
-    video = result.scalar_one_or_none()
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
@@ -502,7 +489,7 @@ async def get_video_stream(
     # YouTube videos: Return YouTube video ID immediately (no HLS generation needed)
     if video.source_type == SourceType.youtube and video.youtube_url:
         try:
-            yt_video_id = extract_video_id(video.youtube_url)
+            yt_video_id = video.youtube_video_id or extract_video_id(video.youtube_url)
             return VideoStreamResponse(
                 status="ready",
                 source_type="youtube",
@@ -527,18 +514,8 @@ async def get_video_stream(
     # Uploaded videos: Direct video streaming via presigned URL
     # For now, skip HLS and use direct MP4 streaming which works with presigned URLs
     try:
-        from app.services.r2_service import get_r2_client
-        client = get_r2_client()
-
-        # Generate presigned URL for direct video access (expires in 1 hour)
-        video_url = client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': settings.r2_bucket_name,
-                'Key': video.r2_key
-            },
-            ExpiresIn=3600
-        )
+        # Presigned URL for direct video access (valid >= 1 hour, stable per 10-minute window)
+        video_url = get_stream_url(video.r2_key, expires_in=3600)
 
         logger.info(f"Generated direct video URL for {video_id}")
 
@@ -564,50 +541,50 @@ async def delete_video_endpoint(
     """
     Delete a video and all associated resources.
 
+    - Soft deletes database record (sets deleted_at timestamp)
     - Deletes video file from R2 storage
     - Deletes HLS files from R2 if they exist
-    - Soft deletes database record (sets deleted_at timestamp)
     - Cascade deletion handles related Transcription automatically
     """
-    # Validate user owns video
-    result = await db.execute(
-        select(Video).filter(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
-    )
-    video = result.scalar_one_or_none()
-
-    if not video:
+    # Validate ownership and soft delete in one round-trip. Only the request
+    # that flips deleted_at gets the keys back, so storage is cleaned up once.
+    row = (await db.execute(
+        update(Video)
+        .where(Video.id == video_id, Video.user_id == user_id, Video.deleted_at.is_(None))
+        .values(deleted_at=func.now())
+        .returning(Video.r2_key, Video.hls_playlist_key)
+        .execution_options(synchronize_session=False)
+    )).first()
+
+    if not row:
         raise HTTPException(status_code=404, detail="Video not found")
 
     try:
-        # Delete video file from R2
-        if video.r2_key:
-            try:
-                delete_video(video.r2_key)
-                logger.info(f"Deleted video from R2: {video.r2_key}")
-            except R2Error as e:
-                logger.warning(f"Failed to delete video from R2: {str(e)}")
-                # Continue with soft delete even if R2 deletion fails
-
-        # Delete HLS files from R2 if they exist
-        if video.hls_playlist_key:
-            try:
-                # Extract HLS directory prefix from playlist key
-                # Format: "videos/user_id/video_id_hls/playlist.m3u8" -> "videos/user_id/video_id_hls"
-                hls_prefix = "/".join(video.hls_playlist_key.split("/")[:-1])
-                delete_hls_directory(hls_prefix)
-                logger.info(f"Deleted HLS files from R2: {hls_prefix}")
-            except R2Error as e:
-                logger.warning(f"Failed to delete HLS files from R2: {str(e)}")
-                # Continue with soft delete even if HLS deletion fails
-
-        # Soft delete video record
-        video.deleted_at = datetime.utcnow()
         await db.commit()
-
         logger.info(f"Soft deleted video {video_id} for user {user_id}")
 
+        # Delete the video file and any HLS files from R2 concurrently
+        cleanups = {}
+        if row.r2_key:
+            cleanups[f"video {row.r2_key}"] = run_in_threadpool(delete_video, row.r2_key)
+        if row.hls_playlist_key:
+            # Extract HLS directory prefix from playlist key
+            # Format: "videos/user_id/video_id_hls/playlist.m3u8" -> "videos/user_id/video_id_hls"
+            hls_prefix = "/".join(row.hls_playlist_key.split("/")[:-1])
+            cleanups[f"HLS files {hls_prefix}"] = run_in_threadpool(delete_hls_directory, hls_prefix)
+
+        results = await asyncio.gather(*cleanups.values(), return_exceptions=True)
+        for target, result in zip(cleanups, results):
+            if isinstance(result, R2Error):
+                # Record is already soft deleted; storage cleanup is best-effort
+                logger.warning(f"Failed to delete {target} from R2: {str(result)}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                logger.info(f"Deleted {target} from R2")
+
         return VideoDeleteResponse(
-            id=video.id,
+            id=video_id,
             deleted=True,
             message="Video and associated resources deleted successfully"
         )
@@ -616,60 +593,3 @@ async def delete_video_endpoint(
         logger.error(f"Unexpected error deleting video {video_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to delete video")
 
-
-async def _generate_hls_background(video_id: str, r2_key: str, user_id: str):
-    """Background task to generate HLS for a video."""
-    from app.database import AsyncSessionLocal
-
-    async with AsyncSessionLocal() as db:
-        try:
-            logger.info(f"Starting HLS generation for video {video_id}")
-
-            # Generate HLS (this is CPU-bound, runs synchronously)
-            playlist_key = generate_hls_for_video(
-                UUID(video_id),
-                r2_key,
-                user_id
-            )
-
-            # Update video record
-            result = await db.execute(
-                select(Video).filter(Video.id == UUID(video_id))
-            )
-            video = result.scalar_one_or_none()
-
-            if video:
-                video.hls_status = HlsStatus.ready
-                video.hls_playlist_key = playlist_key
-                video.hls_generated_at = datetime.utcnow()
-                video.hls_error_message = None
-                await db.commit()
-
-                logger.info(f"HLS generation completed for video {video_id}")
-
-        except HlsGenerationError as e:
-            logger.error(f"HLS generation failed for video {video_id}: {str(e)}")
-
-            # Update video with error
-            result = await db.execute(
-                select(Video).filter(Video.id == UUID(video_id))
-            )
-            video = result.scalar_one_or_none()
-
-            if video:
-                video.hls_status = HlsStatus.failed
-                video.hls_error_message = str(e)
-                await db.commit()
-
-        except Exception as e:
-            logger.error(f"Unexpected error during HLS generation for video {video_id}: {str(e)}")
-
-            result = await db.execute(
-                select(Video).filter(Video.id == UUID(video_id))
-            )
-            video = result.scalar_one_or_none()
-
-            if video:
-                video.hls_status = HlsStatus.failed
-                video.hls_error_message = f"Unexpected error: {str(e)}"
-                await db.commit()
@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from functools import cached_property
 from typing import List
 
 
@@ -38,6 +39,16 @@ class Settings(BaseSettings):
     compression_max_fps: int = 30
     compression_audio_bitrate: str = "96k"  # Sufficient for speech content
     compression_skip_threshold_mb: int = 1000  # Skip compression if file larger than this
+    compression_hw_accel: bool = True  # Prefer a working hardware H.264 encoder over libx264
+
+    # HLS bitrate ladder as "height:kbps" pairs, e.g. "1080:5000,720:2800,480:1400".
+    # Empty keeps the single stream-copied rendition.
+    hls_renditions: str = ""
+
+    # Scratch storage for media intermediates (HLS segments, R2 downloads).
+    # Falls back to the system temp dir when missing or short on space.
+    scratch_dir: str = "/dev/shm"
+    scratch_min_free_mb: int = 256
 
     # R2 (Cloudflare) storage settings
     r2_endpoint_url: str = ""
@@ -46,6 +57,11 @@ class Settings(BaseSettings):
     r2_bucket_name: str = ""
     r2_public_url: str = ""  # Optional: public URL base for accessing videos
     presigned_url_expiration_seconds: int = 3600  # 1 hour default for upload URLs
+    # Multipart tuning for video uploads; concurrency stays <= 8 because R2 has
+    # returned SignatureDoesNotMatch under heavier part concurrency
+    r2_multipart_threshold_mb: int = 8
+    r2_multipart_chunksize_mb: int = 16
+    r2_upload_concurrency: int = 8
 
     # GCP configuration (only used when deployed to GCP)
     gcp_project_id: str = ""
@@ -57,18 +73,34 @@ class Settings(BaseSettings):
     # CORS configuration
     cors_origins: str = "http://localhost:3000,http://localhost:3001,http://localhost:3002"
 
-    @property
+    # Derived values are computed once; settings are not mutated after load
+    @cached_property
     def allowed_formats_list(self) -> List[str]:
         return [fmt.strip() for fmt in self.allowed_video_formats.split(",")]
 
-    @property
+    @cached_property
+    def allowed_formats_set(self) -> frozenset[str]:
+        """Lowercased allowed extensions for O(1) membership checks."""
+        return frozenset(fmt.lower() for fmt in self.allowed_formats_list)
+
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
-    @property
+    @cached_property
     def max_file_size_bytes(self) -> int:
         return self.max_file_size_mb * 1024 * 1024
 
+    @cached_property
+    def hls_renditions_list(self) -> List[tuple[int, int]]:
+        """(height, video kbps) pairs, highest first."""
+        renditions = []
+        for item in self.hls_renditions.split(","):
+            if item.strip():
+                height, kbps = item.split(":")
+                renditions.append((int(height), int(kbps)))
+        return sorted(renditions, reverse=True)
+
     class Config:
         env_file = ".env"
         case_sensitive = False
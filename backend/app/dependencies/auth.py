@@ -1,5 +1,11 @@
 """Authentication dependencies for FastAPI routes."""
 
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
@@ -11,18 +17,121 @@ security = HTTPBearer()
 
 # JWKS client will be initialized lazily to avoid startup issues
 _jwks_client = None
+_jwks_client_lock = threading.Lock()
 
 def get_jwks_client():
     """Get or create JWKS client for Supabase JWT verification."""
     global _jwks_client
     if _jwks_client is None:
-        # Supabase uses JWT Signing Keys (ES256) instead of legacy HS256
-        jwks_url = f"{settings.supabase_url}/auth/v1/.well-known/jwks.json"
-        logger.info(f"Initializing JWKS client with URL: {jwks_url}")
-        _jwks_client = PyJWKClient(jwks_url)
+        with _jwks_client_lock:
+            if _jwks_client is None:
+                # Supabase uses JWT Signing Keys (ES256) instead of legacy HS256
+                jwks_url = f"{settings.supabase_url}/auth/v1/.well-known/jwks.json"
+                logger.info(f"Initializing JWKS client with URL: {jwks_url}")
+                # Keep the JWK set for an hour and memoize kid -> key lookups;
+                # rotated keys are picked up on the next refresh or unknown kid
+                _jwks_client = PyJWKClient(
+                    jwks_url,
+                    cache_keys=True,
+                    max_cached_keys=16,
+                    lifespan=3600
+                )
     return _jwks_client
 
 
+# Verified tokens: sha256(token) -> (user_id, exp). Entries are evicted LRU-first
+# and ignored once exp passes, so a hit never outlives the token itself.
+# Only touched from the event loop thread, so no lock is needed.
+_TOKEN_CACHE_MAX_SIZE = 4096
+_verified_tokens: "OrderedDict[bytes, tuple[str, float]]" = OrderedDict()
+
+# In-flight verifications by token hash, so concurrent first requests with the
+# same token share one verify instead of each running it
+_pending_verifications: dict[bytes, asyncio.Future] = {}
+
+
+def _cached_user_id(key: bytes) -> str | None:
+    """Return the cached user_id for a token hash, or None if absent or expired."""
+    entry = _verified_tokens.get(key)
+    if entry is None:
+        return None
+    user_id, exp = entry
+    if exp <= time.time():
+        del _verified_tokens[key]
+        return None
+    _verified_tokens.move_to_end(key)
+    return user_id
+
+
+def _remember_user_id(key: bytes, user_id: str, exp: float) -> None:
+    """Cache a verified user_id until the token's exp, evicting the oldest entry when full."""
+    _verified_tokens[key] = (user_id, exp)
+    _verified_tokens.move_to_end(key)
+    if len(_verified_tokens) > _TOKEN_CACHE_MAX_SIZE:
+        _verified_tokens.popitem(last=False)
+
+
+def _verify_token(token: str) -> dict:
+    """
+    Verify a Supabase JWT against the JWKS public key and return its claims.
+
+    The token is decoded once: the kid comes from the unverified header, and
+    the single verified decode enforces the sub and exp claims. A token with
+    an empty sub is rejected.
+    """
+    # Get the signing key for the token's kid from the JWKS endpoint
+    header = jwt.get_unverified_header(token)
+    kid = header.get("kid")
+    if not kid:
+        raise jwt.InvalidTokenError("Token header missing 'kid'")
+    signing_key = get_jwks_client().get_signing_key(kid)
+
+    # Supabase uses ES256 (Elliptic Curve) for JWT signing
+    payload = jwt.decode(
+        token,
+        signing_key.key,
+        algorithms=["ES256"],  # Supabase uses ES256, not HS256
+        options={
+            "verify_aud": False,  # Don't verify audience
+            "require": ["sub", "exp"],
+        }
+    )
+
+    # "require" only checks presence; an empty sub must not authenticate (or be cached)
+    if not payload["sub"]:
+        logger.warning("JWT token missing 'sub' claim")
+        raise jwt.InvalidTokenError("Token has an empty 'sub' claim")
+
+    return payload
+
+
+async def _resolve_user_id(token: str) -> str:
+    """
+    Return the user_id (sub claim) for a token, verifying it only on cache miss.
+
+    Repeat requests with the same bearer token are served from the cache by a
+    hash lookup and exp check, skipping the JWKS lookup and EC signature verify.
+    On a miss the verify runs in a worker thread so it never blocks the event
+    loop. Failed verifications raise and are never cached.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    user_id = _cached_user_id(key)
+    if user_id is not None:
+        return user_id
+
+    pending = _pending_verifications.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(asyncio.to_thread(_verify_token, token))
+        _pending_verifications[key] = pending
+        pending.add_done_callback(lambda _: _pending_verifications.pop(key, None))
+
+    # Shield so one cancelled request doesn't cancel the shared verification
+    payload = await asyncio.shield(pending)
+    user_id = payload["sub"]
+    _remember_user_id(key, user_id, payload["exp"])
+    return user_id
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> str:
@@ -39,34 +148,14 @@ async def get_current_user(
         str: User ID (UUID) from token payload
 
     Raises:
-        HTTPException: If token is invalid, expired, or missing user_id
+        HTTPException: If token is invalid, expired, or missing sub/exp claims
     """
     try:
         token = credentials.credentials
         logger.debug(f"Validating JWT token (length: {len(token)})")
 
-        # Get the signing key from JWKS endpoint
-        jwks_client = get_jwks_client()
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
-
-        # Decode and verify Supabase JWT using public key from JWKS
-        # Supabase uses ES256 (Elliptic Curve) for JWT signing
-        payload = jwt.decode(
-            token,
-            signing_key.key,
-            algorithms=["ES256"],  # Supabase uses ES256, not HS256
-            options={"verify_aud": False}  # Don't verify audience
-        )
-
-        # Extract user ID from 'sub' claim
-        user_id = payload.get("sub")
-        if not user_id:
-            logger.warning("JWT token missing 'sub' claim")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Verify Supabase JWT using public key from JWKS (cached per token)
+        user_id = await _resolve_user_id(token)
 
         logger.info(f"Authenticated user: {user_id}")
         return user_id
@@ -94,7 +183,7 @@ async def get_current_user(
         )
 
 
-def get_current_user_optional(
+async def get_current_user_optional(
     credentials: HTTPAuthorizationCredentials | None = Depends(HTTPBearer(auto_error=False))
 ) -> str | None:
     """
@@ -107,15 +196,6 @@ def get_current_user_optional(
         return None
 
     try:
-        token = credentials.credentials
-        jwks_client = get_jwks_client()
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
-        payload = jwt.decode(
-            token,
-            signing_key.key,
-            algorithms=["ES256"],
-            options={"verify_aud": False}
-        )
-        return payload.get("sub")
-    except:
+        return await _resolve_user_id(credentials.credentials)
+    except jwt.PyJWTError:
         return None
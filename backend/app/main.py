@@ -1,12 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 import sys
 from loguru import logger
 
 from app.api import videos, collections
-from app.database import engine, Base
+from app.database import engine, Base, warm_up_pool
 from app.config import settings
+from app.utils.responses import FastJSONResponse
 
 
 # Configure loguru logging
@@ -32,6 +34,7 @@ async def lifespan(app: FastAPI):
     # Startup: Create database tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await warm_up_pool()
     yield
     # Shutdown: Clean up resources
     await engine.dispose()
@@ -42,6 +45,7 @@ app = FastAPI(
     description="FastAPI backend for video upload and AI transcription",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Configure CORS
@@ -53,6 +57,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON bodies (transcripts, notes, video lists); tiny responses aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(videos.router)
 app.include_router(collections.router)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, BigInteger, Enum, ForeignKey, Text, Interval, DateTime
+from sqlalchemy import Column, String, BigInteger, SmallInteger, Enum, ForeignKey, Text, Interval, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -31,11 +31,23 @@ class HlsStatus(str, enum.Enum):
 
 class Collection(Base):
     __tablename__ = "collections"
+    __table_args__ = (
+        # Names are unique per user; also serves user_id lookups as leftmost prefix.
+        # INCLUDE (id) answers id-by-name lookups from the index; description is
+        # left out since unbounded text can exceed the btree tuple limit.
+        Index(
+            "ix_collections_user_id_name_inc",
+            "user_id",
+            "name",
+            unique=True,
+            postgresql_include=["id"],
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False, unique=True)
+    name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
-    user_id = Column(UUID(as_uuid=True), nullable=True, index=True)  # Auth: owner of collection
+    user_id = Column(UUID(as_uuid=True), nullable=False)  # Auth: owner of collection
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -69,6 +81,8 @@ class SourceType(str, enum.Enum):
 
 class Video(Base):
     __tablename__ = "videos"
+    # Fetch server defaults (uploaded_at) via INSERT ... RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     filename = Column(String, nullable=False)
@@ -76,14 +90,15 @@ class Video(Base):
     file_path = Column(String, nullable=False)
     file_size = Column(BigInteger, nullable=False)
     duration_seconds = Column(BigInteger, nullable=True)  # Video duration in seconds
-    uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    uploaded_at = Column(DateTime(timezone=True), server_default=func.now())  # Ordered via ix_videos_user_id_uploaded_at_active
     status = Column(Enum(VideoStatus), default=VideoStatus.uploaded, nullable=False, index=True)
     collection_id = Column(UUID(as_uuid=True), ForeignKey("collections.id", ondelete="SET NULL"), nullable=True, index=True)
-    user_id = Column(UUID(as_uuid=True), nullable=True, index=True)  # Auth: owner of video
+    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)  # Auth: owner of video
 
     # YouTube-specific fields
     source_type = Column(Enum(SourceType), default=SourceType.upload, nullable=False, index=True)
     youtube_url = Column(String, nullable=True)  # Original YouTube URL if source is YouTube
+    youtube_video_id = Column(String(11), nullable=True)  # Parsed once at submission
 
     # R2 storage fields
     r2_key = Column(String, nullable=True, index=True)  # R2 object key (if stored in R2)
@@ -102,8 +117,33 @@ class Video(Base):
     tags = relationship("Tag", secondary="video_tags", back_populates="videos")
 
 
+# Serves list_videos: newest-first listing of a user's non-deleted videos
+Index(
+    "ix_videos_user_id_uploaded_at_active",
+    Video.user_id,
+    Video.uploaded_at.desc(),
+    postgresql_where=Video.deleted_at.is_(None),
+)
+
+
 class Transcription(Base):
     __tablename__ = "transcriptions"
+    __table_args__ = (
+        # Containment (@>) lookups on segments; jsonb_path_ops keeps the index small
+        Index(
+            "ix_transcriptions_segments_gin",
+            "transcript_segments",
+            postgresql_using="gin",
+            postgresql_ops={"transcript_segments": "jsonb_path_ops"},
+        ),
+        # Containment (@>) filters on notes
+        Index(
+            "ix_transcriptions_notes_gin",
+            "notes",
+            postgresql_using="gin",
+            postgresql_ops={"notes": "jsonb_path_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     video_id = Column(UUID(as_uuid=True), ForeignKey("videos.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
@@ -128,4 +168,11 @@ class Transcription(Base):
     # }
     notes = Column(JSONB, nullable=True)
 
+    # Copied out of notes when they are written so list views never read the blob
+    note_summary = Column(Text, nullable=True)
+    key_points_count = Column(SmallInteger, nullable=True)
+    takeaways_count = Column(SmallInteger, nullable=True)
+    tags_count = Column(SmallInteger, nullable=True)
+    quotes_count = Column(SmallInteger, nullable=True)
+
     video = relationship("Video", back_populates="transcription")
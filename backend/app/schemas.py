@@ -1,8 +1,14 @@
-from pydantic import BaseModel, field_serializer, field_validator, Field
+import re
+from pydantic import BaseModel, ConfigDict, computed_field, field_serializer, field_validator, Field
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
-from app.models import VideoStatus, SourceType, HlsStatus
+from app.config import settings
+from app.models import VideoStatus, SourceType
+
+
+_YT_ID_RE = re.compile(r"[a-zA-Z0-9_-]{11}")
+_YT_HOST_RE = re.compile(r"youtube\.com|youtu\.be")
 
 
 class VideoUploadResponse(BaseModel):
@@ -39,14 +45,12 @@ class YouTubeSubmitRequest(BaseModel):
     @classmethod
     def validate_url(cls, v: str) -> str:
         """Validate that URL looks like a YouTube URL or video ID."""
-        import re
-
         # Allow raw video ID (11 characters)
-        if re.match(r"^[a-zA-Z0-9_-]{11}$", v):
+        if _YT_ID_RE.fullmatch(v):
             return v
 
-        # Allow YouTube URLs
-        if "youtube.com" in v or "youtu.be" in v:
+        # Allow YouTube URLs (youtube.com or youtu.be)
+        if _YT_HOST_RE.search(v):
             return v
 
         raise ValueError(
@@ -72,6 +76,9 @@ class YouTubeSubmitResponse(BaseModel):
 class TranscriptSegment(BaseModel):
     """Timestamped segment from Whisper API."""
 
+    # Not extra="forbid": stored transcript_segments JSONB is validated on read
+    model_config = ConfigDict(frozen=True)
+
     start: float
     end: float
     text: str
@@ -91,8 +98,6 @@ class TranscriptionResponse(BaseModel):
 
     # Note generation fields - full JSONB with metadata
     notes: Optional["NotesData"] = None
-    notes_model_used: Optional[str] = None
-    notes_processing_time: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -102,30 +107,26 @@ class TranscriptionResponse(BaseModel):
         """Convert timedelta to readable string format (e.g., '2m 30s')."""
         if value is None:
             return None
-        total_seconds = int(value.total_seconds())
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
+        minutes, seconds = divmod(int(value.total_seconds()), 60)
         if minutes > 0:
             return f"{minutes}m {seconds}s"
         return f"{seconds}s"
 
-    def model_post_init(self, __context) -> None:
-        """Extract notes metadata after model initialization."""
-        if self.notes:
-            # Handle both dict and NotesData object
-            if isinstance(self.notes, dict):
-                self.notes_model_used = self.notes.get("model_used")
-                processing_time_ms = self.notes.get("processing_time_ms")
-            else:
-                self.notes_model_used = getattr(self.notes, "model_used", None)
-                processing_time_ms = getattr(self.notes, "processing_time_ms", None)
-
-            if processing_time_ms:
-                seconds = processing_time_ms // 1000
-                if seconds > 0:
-                    self.notes_processing_time = f"{seconds}s"
-                else:
-                    self.notes_processing_time = f"{processing_time_ms}ms"
+    # Notes metadata is derived at serialization time only
+    @computed_field
+    @property
+    def notes_model_used(self) -> Optional[str]:
+        return self.notes.model_used if self.notes else None
+
+    @computed_field
+    @property
+    def notes_processing_time(self) -> Optional[str]:
+        if not self.notes or not self.notes.processing_time_ms:
+            return None
+        seconds = self.notes.processing_time_ms // 1000
+        if seconds > 0:
+            return f"{seconds}s"
+        return f"{self.notes.processing_time_ms}ms"
 
 
 class VideoListItem(BaseModel):
@@ -139,8 +140,7 @@ class VideoListItem(BaseModel):
     tags_count: Optional[int] = None
     quotes_count: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class VideoListResponse(BaseModel):
@@ -150,6 +150,10 @@ class VideoListResponse(BaseModel):
 class TimestampedItem(BaseModel):
     """Content item with optional timestamp reference."""
 
+    # Not extra="forbid": these also validate LLM output and stored notes,
+    # where a stray key should not fail the whole document.
+    model_config = ConfigDict(frozen=True)
+
     content: str
     timestamp_seconds: Optional[float] = None
 
@@ -157,6 +161,8 @@ class TimestampedItem(BaseModel):
 class ChapterItem(BaseModel):
     """Semantic chapter/segment of the transcript."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     start_seconds: float
     end_seconds: float
@@ -166,6 +172,8 @@ class ChapterItem(BaseModel):
 class SentimentTimelineItem(BaseModel):
     """Sentiment analysis at a specific point in the transcript."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp_seconds: int
     sentiment: str  # 'positive', 'negative', 'neutral'
     intensity: int  # -100 to +100
@@ -175,6 +183,8 @@ class SentimentTimelineItem(BaseModel):
 class ThemeItem(BaseModel):
     """Recurring theme with frequency information."""
 
+    model_config = ConfigDict(frozen=True)
+
     theme: str = Field(description="Theme name")
     frequency: int = Field(description="How many times discussed")
     key_moments: Optional[list[str]] = Field(
@@ -246,16 +256,16 @@ class PresignedUploadRequest(BaseModel):
     filename: str
     file_size: int
     content_type: str = "video/mp4"
+    # Opt in to presigned multipart uploads for files above the multipart threshold
+    multipart: bool = False
 
     @field_validator("filename")
     @classmethod
     def validate_filename(cls, v: str) -> str:
         """Validate filename has allowed extension."""
-        from app.config import settings
-        import os
-
-        ext = os.path.splitext(v)[1].lower().lstrip(".")
-        if ext not in settings.allowed_formats_list:
+        _, dot, ext = v.rpartition(".")
+        ext = ext.lower() if dot else ""
+        if ext not in settings.allowed_formats_set:
             raise ValueError(
                 f"Invalid file extension '{ext}'. Allowed formats: {', '.join(settings.allowed_formats_list)}"
             )
@@ -265,8 +275,6 @@ class PresignedUploadRequest(BaseModel):
     @classmethod
     def validate_file_size(cls, v: int) -> int:
         """Validate file size is within limits."""
-        from app.config import settings
-
         if v > settings.max_file_size_bytes:
             raise ValueError(
                 f"File size ({v / (1024*1024):.1f}MB) exceeds maximum allowed size "
@@ -277,17 +285,36 @@ class PresignedUploadRequest(BaseModel):
         return v
 
 
+class PresignedUploadPart(BaseModel):
+    """Presigned PUT URL for one part of a multipart upload."""
+
+    part_number: int
+    url: str
+
+
 class PresignedUploadResponse(BaseModel):
-    """Response schema with presigned upload URL."""
+    """Response schema with presigned upload URL (or per-part URLs for multipart)."""
 
     video_id: UUID
-    upload_url: str
+    upload_url: Optional[str] = None  # Single PUT URL (non-multipart uploads)
     r2_key: str
     expires_in: int
     status_url: str
+    upload_id: Optional[str] = None  # Multipart upload ID, echoed back on completion
+    part_size: Optional[int] = None  # Bytes per part; the last part may be smaller
+    parts: Optional[list[PresignedUploadPart]] = None
+
+
+class CompletedUploadPart(BaseModel):
+    """Part uploaded by the client, identified by the ETag R2 returned."""
+
+    part_number: int
+    etag: str
 
 
 class UploadCompleteRequest(BaseModel):
     """Request schema for notifying upload completion."""
 
     success: bool
+    upload_id: Optional[str] = None  # Set for multipart uploads
+    parts: Optional[list[CompletedUploadPart]] = None
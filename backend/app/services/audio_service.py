@@ -1,15 +1,30 @@
+import re
+import asyncio
 import subprocess
 import tempfile
 import os
 from pathlib import Path
+from typing import Optional
 from loguru import logger
 
 
+# Input duration line ffmpeg prints to stderr, e.g. "Duration: 00:12:34.56,"
+_FFMPEG_DURATION_RE = re.compile(rb"Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
+
 class AudioExtractionError(Exception):
     """Raised when audio extraction fails."""
     pass
 
 
+def _stat_or_raise(path: str, message: str) -> os.stat_result:
+    """Stat a file in one syscall, raising AudioExtractionError if it is missing."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        raise AudioExtractionError(message)
+
+
 def get_video_duration(video_path: str) -> float:
     """
     Get video duration in seconds using ffprobe.
@@ -41,21 +56,39 @@ def get_video_duration(video_path: str) -> float:
         raise AudioExtractionError(f"Could not parse video duration: {str(e)}")
 
 
-def extract_audio(video_path: str) -> tuple[str, int]:
+def parse_ffmpeg_duration(stderr: bytes) -> Optional[float]:
     """
-    Extract audio from video file using ffmpeg.
+    Parse the input duration from ffmpeg's stderr banner.
+
+    Args:
+        stderr: Raw stderr captured from an ffmpeg run
+
+    Returns:
+        Duration in seconds, or None if ffmpeg did not report one (e.g. "N/A")
+    """
+    match = _FFMPEG_DURATION_RE.search(stderr)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def extract_audio_to_memory(video_path: str) -> tuple[bytes, Optional[float]]:
+    """
+    Extract audio from video file using ffmpeg, piping the MP3 to memory.
 
     Audio is optimized for speech transcription with gpt-4o-mini-transcribe:
     - Mono channel (reduces size by ~50%)
     - 16 kHz sample rate (optimal for speech recognition)
-    - 32 kbps bitrate (sufficient quality for mono speech)
+    - 32 kbps bitrate (sufficient quality for mono speech, ~14 MB per hour)
     - Target: Keep audio files under 25 MB API limit
 
     Args:
         video_path: Path to input video file
 
     Returns:
-        Tuple of (path to extracted audio file, audio file size in bytes)
+        Tuple of (MP3 bytes, source duration in seconds or None). The duration
+        is read from the same ffmpeg run, so callers don't need a separate ffprobe.
 
     Raises:
         AudioExtractionError: If extraction fails
@@ -63,11 +96,6 @@ def extract_audio(video_path: str) -> tuple[str, int]:
     if not os.path.exists(video_path):
         raise AudioExtractionError(f"Video file not found: {video_path}")
 
-    # Create temporary file for audio output
-    temp_dir = tempfile.gettempdir()
-    audio_filename = f"{Path(video_path).stem}_audio.mp3"
-    output_path = os.path.join(temp_dir, audio_filename)
-
     try:
         cmd = [
             "ffmpeg",
@@ -77,8 +105,8 @@ def extract_audio(video_path: str) -> tuple[str, int]:
             "-ac", "1",  # Convert to mono (reduces file size by ~50%)
             "-ar", "16000",  # Downsample to 16 kHz (optimal for speech recognition)
             "-b:a", "32k",  # Lower bitrate to 32 kbps (sufficient for mono speech)
-            "-y",  # Overwrite output file if exists
-            output_path
+            "-f", "mp3",
+            "pipe:1"  # Write to stdout instead of a temp file
         ]
 
         result = subprocess.run(
@@ -88,22 +116,22 @@ def extract_audio(video_path: str) -> tuple[str, int]:
             timeout=300  # 5 minute timeout
         )
 
-        if not os.path.exists(output_path):
-            raise AudioExtractionError("Audio file was not created")
-
-        # Get audio file size
-        audio_size = os.path.getsize(output_path)
+        audio_bytes = result.stdout
+        if not audio_bytes:
+            raise AudioExtractionError("ffmpeg produced no audio")
 
         # Log audio size for monitoring
-        size_mb = audio_size / (1024 * 1024)
-        size_kb = audio_size / 1024
+        size_mb = len(audio_bytes) / (1024 * 1024)
+        size_kb = len(audio_bytes) / 1024
         if size_mb >= 1:
             logger.info(f"Audio extracted: {size_mb:.2f} MB")
         else:
             logger.info(f"Audio extracted: {size_kb:.2f} KB")
 
-        return output_path, audio_size
+        return audio_bytes, parse_ffmpeg_duration(result.stderr)
 
+    except AudioExtractionError:
+        raise
     except subprocess.TimeoutExpired:
         raise AudioExtractionError("Audio extraction timed out")
     except subprocess.CalledProcessError as e:
@@ -113,13 +141,63 @@ def extract_audio(video_path: str) -> tuple[str, int]:
         raise AudioExtractionError(f"Unexpected error during audio extraction: {str(e)}")
 
 
-def split_audio_into_chunks(audio_path: str, max_chunk_size_mb: int = 10) -> list[tuple[str, int]]:
+def save_audio_file(audio_bytes: bytes, name: str) -> str:
+    """
+    Write extracted audio to a temporary MP3 file.
+
+    Args:
+        audio_bytes: MP3 data
+        name: Base name for the file (e.g. the source video's stem)
+
+    Returns:
+        Path to the written audio file
+
+    Raises:
+        AudioExtractionError: If the file cannot be written
+    """
+    output_path = os.path.join(tempfile.gettempdir(), f"{name}_audio.mp3")
+    try:
+        with open(output_path, "wb") as f:
+            f.write(audio_bytes)
+    except OSError as e:
+        raise AudioExtractionError(f"Could not write audio file: {str(e)}")
+    return output_path
+
+
+def extract_audio(video_path: str) -> tuple[str, int, Optional[float]]:
+    """
+    Extract audio from video file into a temporary MP3 file.
+
+    Args:
+        video_path: Path to input video file
+
+    Returns:
+        Tuple of (path to extracted audio file, audio file size in bytes,
+        source duration in seconds or None)
+
+    Raises:
+        AudioExtractionError: If extraction fails
+    """
+    audio_bytes, duration = extract_audio_to_memory(video_path)
+    output_path = save_audio_file(audio_bytes, Path(video_path).stem)
+    return output_path, len(audio_bytes), duration
+
+
+async def split_audio_into_chunks(
+    audio_path: str,
+    max_chunk_size_mb: int = 10,
+    total_duration: Optional[float] = None
+) -> list[tuple[str, int]]:
     """
     Split audio file into smaller chunks if needed.
 
+    Uses ffmpeg's segment muxer, so all chunks are written in one sequential
+    pass over the input with stream copy (no re-encoding).
+
     Args:
         audio_path: Path to audio file
         max_chunk_size_mb: Maximum size per chunk in MB (default 10 MB to stay well under 25 MB limit)
+        total_duration: Audio duration in seconds if already known (skips ffprobe)
 
     Returns:
         List of tuples: [(chunk_path, chunk_size), ...]
@@ -127,10 +205,7 @@ def split_audio_into_chunks(audio_path: str, max_chunk_size_mb: int = 10) -> lis
     Raises:
         AudioExtractionError: If splitting fails
     """
-    if not os.path.exists(audio_path):
-        raise AudioExtractionError(f"Audio file not found: {audio_path}")
-
-    audio_size = os.path.getsize(audio_path)
+    audio_size = _stat_or_raise(audio_path, f"Audio file not found: {audio_path}").st_size
     max_chunk_bytes = max_chunk_size_mb * 1024 * 1024
 
     # If file is already small enough, return as single chunk
@@ -138,19 +213,12 @@ def split_audio_into_chunks(audio_path: str, max_chunk_size_mb: int = 10) -> lis
         logger.info(f"Audio file {audio_size / (1024*1024):.2f} MB, no splitting needed")
         return [(audio_path, audio_size)]
 
-    # Get audio duration using ffprobe
-    try:
-        probe_cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            audio_path
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=30)
-        total_duration = float(result.stdout.strip())
-    except Exception as e:
-        raise AudioExtractionError(f"Could not get audio duration: {str(e)}")
+    # Get audio duration using ffprobe unless the caller already has it
+    if total_duration is None:
+        try:
+            total_duration = await asyncio.to_thread(get_video_duration, audio_path)
+        except AudioExtractionError as e:
+            raise AudioExtractionError(f"Could not get audio duration: {str(e)}")
 
     # Calculate chunk parameters
     num_chunks = int((audio_size / max_chunk_bytes) + 1)
@@ -158,64 +226,72 @@ def split_audio_into_chunks(audio_path: str, max_chunk_size_mb: int = 10) -> lis
 
     logger.info(f"Splitting {audio_size / (1024*1024):.2f} MB audio into {num_chunks} chunks")
 
-    # Split audio into chunks
-    chunks = []
     temp_dir = tempfile.gettempdir()
     base_name = Path(audio_path).stem
+    chunk_pattern = f"{base_name}_chunk_*.mp3"
+
+    # Remove leftovers from an earlier run so the glob below only sees this split
+    for stale in Path(temp_dir).glob(chunk_pattern):
+        cleanup_audio_file(str(stale))
+
+    cmd = [
+        "ffmpeg",
+        "-i", audio_path,
+        "-f", "segment",
+        "-segment_time", str(chunk_duration),
+        "-segment_start_number", "1",
+        "-reset_timestamps", "1",
+        "-acodec", "copy",  # Copy codec, no re-encoding
+        "-y",
+        os.path.join(temp_dir, f"{base_name}_chunk_%03d.mp3")
+    ]
 
     try:
-        for i in range(num_chunks):
-            start_time = i * chunk_duration
-            chunk_filename = f"{base_name}_chunk_{i+1:03d}.mp3"
-            chunk_path = os.path.join(temp_dir, chunk_filename)
-
-            cmd = [
-                "ffmpeg",
-                "-i", audio_path,
-                "-ss", str(start_time),
-                "-t", str(chunk_duration),
-                "-acodec", "copy",  # Copy codec, no re-encoding
-                "-y",
-                chunk_path
-            ]
-
-            subprocess.run(cmd, check=True, capture_output=True, timeout=60)
-
-            if not os.path.exists(chunk_path):
-                raise AudioExtractionError(f"Chunk {i+1} was not created")
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=120)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise AudioExtractionError("Audio splitting timed out")
+
+        if process.returncode != 0:
+            raise AudioExtractionError(f"ffmpeg chunk error: {stderr.decode(errors='replace')}")
+
+        chunks = [
+            (str(chunk_path), chunk_path.stat().st_size)
+            for chunk_path in sorted(Path(temp_dir).glob(chunk_pattern))
+        ]
 
-            chunk_size = os.path.getsize(chunk_path)
-            chunks.append((chunk_path, chunk_size))
+        if not chunks:
+            raise AudioExtractionError("No chunks were created")
 
-            logger.info(f"Created chunk {i+1}/{num_chunks}: {chunk_size / (1024*1024):.2f} MB")
+        chunk_sizes = ", ".join(f"{size / (1024*1024):.2f}" for _, size in chunks)
+        logger.info(f"Split audio into {len(chunks)} chunks (MB: {chunk_sizes})")
 
         return chunks
 
-    except subprocess.TimeoutExpired:
-        # Cleanup partial chunks
-        for chunk_path, _ in chunks:
-            cleanup_audio_file(chunk_path)
-        raise AudioExtractionError("Audio splitting timed out")
-    except subprocess.CalledProcessError as e:
-        # Cleanup partial chunks
-        for chunk_path, _ in chunks:
-            cleanup_audio_file(chunk_path)
-        error_msg = e.stderr.decode() if e.stderr else str(e)
-        raise AudioExtractionError(f"ffmpeg chunk error: {error_msg}")
     except Exception as e:
         # Cleanup partial chunks
-        for chunk_path, _ in chunks:
-            cleanup_audio_file(chunk_path)
+        for stale in Path(temp_dir).glob(chunk_pattern):
+            cleanup_audio_file(str(stale))
+        if isinstance(e, AudioExtractionError):
+            raise
         raise AudioExtractionError(f"Unexpected error during splitting: {str(e)}")
 
 
 def cleanup_audio_file(audio_path: str) -> None:
     """Delete temporary audio file."""
     try:
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
+        os.remove(audio_path)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        print(f"Warning: Could not delete audio file {audio_path}: {e}")
+        logger.warning(f"Could not delete audio file {audio_path}: {e}")
 
 
 def cleanup_audio_chunks(chunks: list[tuple[str, int]]) -> None:
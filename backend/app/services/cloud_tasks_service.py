@@ -1,20 +1,115 @@
 """Google Cloud Tasks service for managing video processing jobs."""
-import json
+import threading
+import time
+from functools import lru_cache
 from google.cloud import tasks_v2
 from google.protobuf import timestamp_pb2, duration_pb2
-from datetime import datetime, timedelta
+from pydantic_core import to_json
 from typing import Optional
 from loguru import logger
 
 from app.config import settings
 
 
+# Maximum dispatch deadline Cloud Tasks allows for HTTP targets (30 minutes)
+_DISPATCH_DEADLINE = duration_pb2.Duration(seconds=1800)
+
+
 class CloudTasksError(Exception):
     """Exception raised when Cloud Tasks operations fail."""
     pass
 
 
-def create_video_processing_task(
+# Shared sync client: reuses one gRPC channel and credentials for all calls
+_client: Optional[tasks_v2.CloudTasksClient] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> tasks_v2.CloudTasksClient:
+    """Get or create the shared Cloud Tasks client."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = tasks_v2.CloudTasksClient()
+    return _client
+
+
+# Shared async client: created on first use from the event loop it is bound to
+_async_client: Optional[tasks_v2.CloudTasksAsyncClient] = None
+
+
+def _get_async_client() -> tasks_v2.CloudTasksAsyncClient:
+    """Get or create the shared async Cloud Tasks client (call from the event loop)."""
+    global _async_client
+    if _async_client is None:
+        _async_client = tasks_v2.CloudTasksAsyncClient()
+    return _async_client
+
+
+def _build_video_processing_task(
+    video_id: str,
+    r2_key: str,
+    user_id: str,
+    delay_seconds: int = 0
+) -> dict:
+    """
+    Build the Cloud Task definition for processing a video.
+
+    Args:
+        video_id: Video database ID
+        r2_key: R2 storage key for the video file
+        user_id: User ID who owns the video
+        delay_seconds: Optional delay before task execution
+
+    Returns:
+        Task dict accepted by create_task
+    """
+    # Build task payload
+    task_payload = {
+        "video_id": video_id,
+        "r2_key": r2_key,
+        "user_id": user_id
+    }
+
+    # Construct the task
+    task = {
+        "http_request": {
+            "http_method": tasks_v2.HttpMethod.POST,
+            "url": f"{settings.worker_service_url}/process-video",
+            "headers": {
+                "Content-Type": "application/json",
+            },
+            "body": to_json(task_payload),  # Native encoder, returns bytes
+            "oidc_token": {
+                "service_account_email": settings.cloud_tasks_service_account
+            }
+        },
+        "dispatch_deadline": _DISPATCH_DEADLINE
+    }
+
+    # Add delay if specified
+    if delay_seconds > 0:
+        when = time.time() + delay_seconds
+        task["schedule_time"] = timestamp_pb2.Timestamp(
+            seconds=int(when),
+            nanos=int((when % 1) * 1e9)
+        )
+
+    return task
+
+
+@lru_cache(maxsize=1)
+def _queue_path() -> str:
+    """Full resource path of the video processing queue (constant per deployment)."""
+    return tasks_v2.CloudTasksClient.queue_path(
+        settings.gcp_project_id,
+        settings.gcp_region,
+        settings.cloud_tasks_queue
+    )
+
+
+async def create_video_processing_task(
     video_id: str,
     r2_key: str,
     user_id: str,
@@ -36,51 +131,13 @@ def create_video_processing_task(
         CloudTasksError: If task creation fails
     """
     try:
-        # Create Cloud Tasks client
-        client = tasks_v2.CloudTasksClient()
-
-        # Construct the queue path
-        queue_path = client.queue_path(
-            settings.gcp_project_id,
-            settings.gcp_region,
-            settings.cloud_tasks_queue
-        )
-
-        # Build task payload
-        task_payload = {
-            "video_id": video_id,
-            "r2_key": r2_key,
-            "user_id": user_id
-        }
-
-        # Construct the task
-        task = {
-            "http_request": {
-                "http_method": tasks_v2.HttpMethod.POST,
-                "url": f"{settings.worker_service_url}/process-video",
-                "headers": {
-                    "Content-Type": "application/json",
-                },
-                "body": json.dumps(task_payload).encode(),
-                "oidc_token": {
-                    "service_account_email": settings.cloud_tasks_service_account
-                }
-            },
-            # Set dispatch deadline to maximum allowed (30 minutes)
-            # Cloud Tasks maximum is 1800s (30 min) for HTTP targets
-            "dispatch_deadline": duration_pb2.Duration(seconds=1800)
-        }
+        client = _get_async_client()
 
-        # Add delay if specified
-        if delay_seconds > 0:
-            schedule_time = datetime.utcnow() + timedelta(seconds=delay_seconds)
-            timestamp = timestamp_pb2.Timestamp()
-            timestamp.FromDatetime(schedule_time)
-            task["schedule_time"] = timestamp
+        task = _build_video_processing_task(video_id, r2_key, user_id, delay_seconds)
 
         # Create the task
-        response = client.create_task(
-            request={"parent": queue_path, "task": task}
+        response = await client.create_task(
+            request={"parent": _queue_path(), "task": task}
         )
 
         logger.info(
@@ -105,7 +162,7 @@ def delete_task(task_name: str) -> None:
         CloudTasksError: If task deletion fails
     """
     try:
-        client = tasks_v2.CloudTasksClient()
+        client = _get_client()
         client.delete_task(name=task_name)
         logger.info(f"Deleted Cloud Task: {task_name}")
     except Exception as e:
@@ -128,7 +185,7 @@ def get_task_status(task_name: str) -> Optional[dict]:
         CloudTasksError: If status check fails
     """
     try:
-        client = tasks_v2.CloudTasksClient()
+        client = _get_client()
         task = client.get_task(name=task_name)
 
         return {
@@ -1,20 +1,50 @@
 """HLS video streaming service for on-demand HLS generation."""
 import os
+import json
+import time
+import shutil
 import tempfile
 import subprocess
-from pathlib import Path
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, Optional
 from datetime import datetime
+from functools import lru_cache
 from uuid import UUID
 from loguru import logger
 
 from app.services.r2_service import (
-    download_video,
     get_r2_client,
+    get_stream_url,
+    get_video_url,
     R2Error,
-    cleanup_temp_file
+    SEGMENT_TRANSFER_CONFIG
 )
+from app.services.video_compression_service import _spawn_ffmpeg
 from app.config import settings
+from app.utils.scratch import get_scratch_dir
+
+
+# Segment uploads are latency-bound, so many small PUTs are kept in flight.
+# generate_hls_for_video is synchronous and never touches an event loop, so a
+# plain thread pool on the shared sync client fans out uploads without loop
+# handoffs.
+HLS_UPLOAD_CONCURRENCY = 32
+
+MASTER_PLAYLIST_NAME = 'master.m3u8'
+TS_CONTENT_TYPE = 'video/mp2t'
+PLAYLIST_CONTENT_TYPE = 'application/vnd.apple.mpegurl'
+
+# DeleteObjects accepts at most 1000 keys; independent batches run in parallel
+DELETE_BATCH_SIZE = 1000
+DELETE_CONCURRENCY = 8
+
+# Codecs that can be stream-copied into MPEG-TS segments; anything else is
+# transcoded, per track
+HLS_COPY_VIDEO_CODECS = frozenset({"h264", "hevc"})
+HLS_COPY_AUDIO_CODECS = frozenset({"aac", "ac3", "mp3"})
+
+HLS_TIMEOUT_SECONDS = 600
+HLS_POLL_INTERVAL_SECONDS = 0.5
 
 
 class HlsGenerationError(Exception):
@@ -22,74 +52,153 @@ class HlsGenerationError(Exception):
     pass
 
 
-def generate_hls_for_video(video_id: UUID, r2_key: str, user_id: Optional[str] = None) -> str:
+def generate_hls_for_video(
+    video_id: UUID,
+    r2_key: str,
+    user_id: Optional[str] = None,
+    force: bool = False
+) -> str:
     """
     Generate HLS playlist and segments for a video.
 
-    Downloads source video from R2, generates HLS using FFmpeg (copy codec),
-    uploads segments back to R2, and returns the playlist R2 key.
+    FFmpeg reads the source straight from R2 via a presigned URL and writes
+    segments to a temp directory. Each segment is uploaded as soon as it
+    appears in the playlist, so uploads overlap with segmenting. The
+    playlist is uploaded once every segment is in R2.
+
+    When settings.hls_renditions defines a bitrate ladder, a single FFmpeg
+    process decodes the source once and encodes every rendition into its own
+    subdirectory, and the entry point is master.m3u8 instead.
+
+    The entry playlist is uploaded last, so its presence means a previous run
+    finished; unless forced, it is returned without re-encoding.
 
     Args:
         video_id: UUID of the video
         r2_key: R2 key of source video
         user_id: User ID for organizing HLS files
+        force: Regenerate even if the playlist already exists in R2
 
     Returns:
-        R2 key of the HLS playlist (playlist.m3u8)
+        R2 key of the HLS entry playlist (playlist.m3u8 or master.m3u8)
 
     Raises:
         HlsGenerationError: If FFmpeg fails or R2 operations fail
     """
-    temp_video_path = None
     temp_hls_dir = None
+    hls_prefix = f"videos/{user_id}/{video_id}_hls" if user_id else f"videos/{video_id}_hls"
+    renditions = settings.hls_renditions_list
+    entry_key = f"{hls_prefix}/{MASTER_PLAYLIST_NAME if renditions else 'playlist.m3u8'}"
+
+    if not force and check_hls_exists(entry_key):
+        logger.info(f"HLS already exists for video {video_id}, skipping generation")
+        return entry_key
 
     try:
-        # Download source video from R2
-        logger.info(f"Downloading source video from R2: {r2_key}")
-        temp_video_path, file_size = download_video(r2_key)
-        logger.info(f"Downloaded video to {temp_video_path} ({file_size} bytes)")
+        # FFmpeg range-reads the source over HTTP, so no local download is needed
+        source_url = get_video_url(r2_key)
 
-        # Create temp directory for HLS output
-        temp_hls_dir = tempfile.mkdtemp(prefix=f"hls_{video_id}_")
-        output_playlist = os.path.join(temp_hls_dir, "playlist.m3u8")
-        segment_pattern = os.path.join(temp_hls_dir, "segment%d.ts")
+        # Create temp directory for HLS output, on tmpfs when it has room
+        temp_hls_dir = tempfile.mkdtemp(
+            prefix=f"hls_{video_id}_",
+            dir=get_scratch_dir(settings.max_file_size_bytes)
+        )
 
-        logger.info(f"Generating HLS in {temp_hls_dir}")
+        logger.info(f"Generating HLS in {temp_hls_dir} from {r2_key}")
+
+        if renditions:
+            # One subdirectory per rendition ("" is the single-rendition root)
+            variants = [f"{height}p" for height, _ in renditions]
+            for variant in variants:
+                os.makedirs(os.path.join(temp_hls_dir, variant))
+            output_args = _rendition_args(source_url, renditions, temp_hls_dir)
+        else:
+            variants = [""]
+            # Copy HLS-compatible tracks, transcode the rest, 6-second segments
+            output_args = [
+                *_codec_args(source_url),
+                "-start_number", "0",
+                "-hls_time", "6",  # 6-second segments
+                "-hls_list_size", "0",  # Include all segments in playlist
+                "-hls_segment_filename", os.path.join(temp_hls_dir, "segment%d.ts"),
+                "-f", "hls",
+                os.path.join(temp_hls_dir, "playlist.m3u8")
+            ]
 
-        # FFmpeg command: copy codec (no re-encoding), 6-second segments
         ffmpeg_cmd = [
             "ffmpeg",
-            "-i", temp_video_path,
-            "-c:v", "copy",  # Copy video codec (no re-encoding)
-            "-c:a", "copy",  # Copy audio codec (no re-encoding)
-            "-start_number", "0",
-            "-hls_time", "6",  # 6-second segments
-            "-hls_list_size", "0",  # Include all segments in playlist
-            "-hls_segment_filename", segment_pattern,
-            "-f", "hls",
-            output_playlist
+            "-nostats",
+            "-loglevel", "error",
+            "-i", source_url,
+            *output_args
         ]
 
-        # Run FFmpeg
         start_time = datetime.now()
-        result = subprocess.run(
-            ffmpeg_cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10-minute timeout
-        )
-
-        if result.returncode != 0:
-            error_msg = f"FFmpeg failed: {result.stderr}"
-            logger.error(error_msg)
-            raise HlsGenerationError(error_msg)
+        client = get_r2_client()
+        submitted: set[tuple[str, str]] = set()
+
+        with ThreadPoolExecutor(
+            max_workers=HLS_UPLOAD_CONCURRENCY,
+            thread_name_prefix="hls-upload"
+        ) as executor:
+            futures = []
+            # stderr is drained on a thread so a chatty failure can't fill the
+            # pipe and stall FFmpeg while this loop polls
+            process, reader, stderr_tail = _spawn_ffmpeg(ffmpeg_cmd)
+            try:
+                while True:
+                    # Check exit status first so the last playlist read is final
+                    returncode = process.poll()
+
+                    # FFmpeg rewrites each playlist after a segment is closed
+                    for variant in variants:
+                        local_dir = os.path.join(temp_hls_dir, variant)
+                        r2_dir = f"{hls_prefix}/{variant}" if variant else hls_prefix
+                        playlist_path = os.path.join(local_dir, "playlist.m3u8")
+                        for filename in _completed_segments(playlist_path):
+                            if (variant, filename) not in submitted:
+                                submitted.add((variant, filename))
+                                futures.append(executor.submit(
+                                    _upload_segment, client, local_dir, r2_dir, filename
+                                ))
+
+                    if returncode is not None:
+                        break
+                    if (datetime.now() - start_time).total_seconds() > HLS_TIMEOUT_SECONDS:
+                        raise subprocess.TimeoutExpired(ffmpeg_cmd, HLS_TIMEOUT_SECONDS)
+                    time.sleep(HLS_POLL_INTERVAL_SECONDS)
+
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                reader.join()
+
+            if returncode != 0:
+                stderr = "\n".join(stderr_tail)
+                error_msg = f"FFmpeg failed: {stderr}"
+                logger.error(error_msg)
+                raise HlsGenerationError(error_msg)
+
+            for future in as_completed(futures):
+                future.result()
 
         elapsed = (datetime.now() - start_time).total_seconds()
-        logger.info(f"HLS generation complete in {elapsed:.2f}s")
-
-        # Upload HLS files to R2
-        hls_prefix = f"videos/{user_id}/{video_id}_hls" if user_id else f"videos/{video_id}_hls"
-        playlist_key = upload_hls_segments(temp_hls_dir, hls_prefix)
+        logger.info(f"HLS generation complete in {elapsed:.2f}s ({len(submitted)} segments)")
+
+        # Upload playlists last so they never reference a missing segment,
+        # with the entry playlist after every variant
+        for variant in variants:
+            if variant:
+                _upload_playlist(
+                    client,
+                    os.path.join(temp_hls_dir, variant, "playlist.m3u8"),
+                    f"{hls_prefix}/{variant}"
+                )
+        entry_name = MASTER_PLAYLIST_NAME if renditions else "playlist.m3u8"
+        playlist_key = _upload_playlist(
+            client, os.path.join(temp_hls_dir, entry_name), hls_prefix
+        )
 
         logger.info(f"HLS uploaded to R2: {playlist_key}")
 
@@ -97,18 +206,178 @@ def generate_hls_for_video(video_id: UUID, r2_key: str, user_id: Optional[str] =
 
     except subprocess.TimeoutExpired:
         raise HlsGenerationError("HLS generation timed out (>10 minutes)")
+    except HlsGenerationError:
+        raise
     except R2Error as e:
         raise HlsGenerationError(f"R2 operation failed: {str(e)}")
     except Exception as e:
         raise HlsGenerationError(f"Unexpected error during HLS generation: {str(e)}")
     finally:
         # Cleanup temp files
-        if temp_video_path:
-            cleanup_temp_file(temp_video_path)
         if temp_hls_dir:
             cleanup_hls_temp_files(temp_hls_dir)
 
 
+def _probe_codecs(source: str) -> tuple[Optional[str], Optional[str]]:
+    """
+    Return the (video, audio) codec names of the first stream of each type.
+
+    Args:
+        source: Local path or URL of the source video
+
+    Returns:
+        Tuple of codec names; an entry is None if that stream type is absent
+    """
+    probe_cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries", "stream=codec_type,codec_name",
+        "-of", "json",
+        source
+    ]
+    result = subprocess.run(probe_cmd, capture_output=True, timeout=30, check=True)
+
+    codecs: dict[str, str] = {}
+    for stream in json.loads(result.stdout).get("streams", []):
+        codecs.setdefault(stream.get("codec_type"), stream.get("codec_name"))
+    return codecs.get("video"), codecs.get("audio")
+
+
+def _codec_args(source: str) -> list[str]:
+    """Choose per-track copy or transcode arguments for the HLS muxer."""
+    try:
+        video_codec, audio_codec = _probe_codecs(source)
+    except (subprocess.SubprocessError, ValueError) as e:
+        # Keep the previous copy-only behavior if the probe itself fails
+        logger.warning(f"ffprobe failed, assuming HLS-compatible codecs: {str(e)}")
+        return ["-c:v", "copy", "-c:a", "copy"]
+
+    args = []
+    if video_codec is None or video_codec in HLS_COPY_VIDEO_CODECS:
+        args += ["-c:v", "copy"]
+    else:
+        logger.info(f"Transcoding {video_codec} video to H.264 for HLS")
+        args += ["-c:v", "libx264", "-preset", "veryfast", "-crf", "23"]
+
+    if audio_codec is None or audio_codec in HLS_COPY_AUDIO_CODECS:
+        args += ["-c:a", "copy"]
+    else:
+        logger.info(f"Transcoding {audio_codec} audio to AAC for HLS")
+        args += ["-c:a", "aac", "-b:a", "128k"]
+
+    return args
+
+
+def _rendition_args(
+    source: str,
+    renditions: list[tuple[int, int]],
+    output_dir: str
+) -> list[str]:
+    """
+    Build output arguments that encode every rendition from one decode.
+
+    The source video is split once in the filter graph and each branch is
+    scaled (never upscaled) and encoded by its own libx264 instance inside
+    the same FFmpeg process. Keyframes are forced on the 6-second segment
+    grid so variants stay switchable at every segment boundary.
+
+    Args:
+        source: Local path or URL of the source video
+        renditions: (height, video kbps) pairs
+        output_dir: Directory holding one <height>p subdirectory per rendition
+
+    Returns:
+        FFmpeg arguments following the input, ending with the output pattern
+    """
+    try:
+        _, audio_codec = _probe_codecs(source)
+        has_audio = audio_codec is not None
+    except (subprocess.SubprocessError, ValueError) as e:
+        logger.warning(f"ffprobe failed, assuming the source has audio: {str(e)}")
+        has_audio = True
+
+    count = len(renditions)
+    split = f"[0:v]split={count}" + "".join(f"[v{i}]" for i in range(count))
+    scales = ";".join(
+        f"[v{i}]scale=-2:'min({height},ih)'[v{i}out]"
+        for i, (height, _) in enumerate(renditions)
+    )
+    args = ["-filter_complex", f"{split};{scales}"]
+
+    stream_map = []
+    for i, (height, kbps) in enumerate(renditions):
+        args += [
+            "-map", f"[v{i}out]",
+            f"-c:v:{i}", "libx264",
+            f"-b:v:{i}", f"{kbps}k",
+            f"-maxrate:v:{i}", f"{kbps}k",
+            f"-bufsize:v:{i}", f"{kbps * 2}k",
+        ]
+        stream_map.append(f"v:{i},a:{i},name:{height}p" if has_audio else f"v:{i},name:{height}p")
+
+    if has_audio:
+        args += [arg for _ in renditions for arg in ("-map", "0:a:0")]
+        args += ["-c:a", "aac", "-b:a", "128k"]
+
+    args += [
+        "-preset", "veryfast",
+        "-force_key_frames", "expr:gte(t,n_forced*6)",
+        "-start_number", "0",
+        "-hls_time", "6",
+        "-hls_list_size", "0",
+        "-master_pl_name", MASTER_PLAYLIST_NAME,
+        "-hls_segment_filename", os.path.join(output_dir, "%v", "segment%d.ts"),
+        "-var_stream_map", " ".join(stream_map),
+        "-f", "hls",
+        os.path.join(output_dir, "%v", "playlist.m3u8")
+    ]
+    return args
+
+
+def _completed_segments(playlist_path: str) -> list[str]:
+    """Return segment filenames listed in an in-progress playlist."""
+    try:
+        with open(playlist_path) as f:
+            return [
+                os.path.basename(line.strip())
+                for line in f
+                if line.strip().endswith('.ts')
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _upload_segment(client, local_dir: str, r2_prefix: str, filename: str) -> None:
+    """Upload a single .ts segment to R2."""
+    client.upload_file(
+        os.path.join(local_dir, filename),
+        settings.r2_bucket_name,
+        f"{r2_prefix}/{filename}",
+        ExtraArgs={'ContentType': TS_CONTENT_TYPE},  # Fresh dict: s3transfer may add defaults in place
+        Config=SEGMENT_TRANSFER_CONFIG
+    )
+
+
+def _segment_number(filename: str) -> float:
+    """Sort key for segment<N>.ts names; unexpected names sort last."""
+    number = filename.removeprefix('segment').removesuffix('.ts')
+    return int(number) if number.isdigit() else float('inf')
+
+
+def _upload_playlist(client, playlist_path: str, r2_prefix: str) -> str:
+    """Upload a .m3u8 playlist to R2 under its file name and return its key."""
+    playlist_key = f"{r2_prefix}/{os.path.basename(playlist_path)}"
+    client.upload_file(
+        playlist_path,
+        settings.r2_bucket_name,
+        playlist_key,
+        ExtraArgs={'ContentType': PLAYLIST_CONTENT_TYPE},
+        Config=SEGMENT_TRANSFER_CONFIG
+    )
+    logger.info(f"Uploaded playlist: {playlist_key}")
+    return playlist_key
+
+
 def upload_hls_segments(local_dir: str, r2_prefix: str) -> str:
     """
     Upload HLS playlist and segments to R2.
@@ -130,36 +399,30 @@ def upload_hls_segments(local_dir: str, r2_prefix: str) -> str:
         if not os.path.exists(playlist_path):
             raise R2Error(f"Playlist not found: {playlist_path}")
 
-        # Upload playlist
-        playlist_key = f"{r2_prefix}/playlist.m3u8"
-        with open(playlist_path, 'rb') as f:
-            client.upload_fileobj(
-                f,
-                settings.r2_bucket_name,
-                playlist_key,
-                ExtraArgs={'ContentType': 'application/vnd.apple.mpegurl'}
+        # Submit in playback order so early segments land first
+        with os.scandir(local_dir) as entries:
+            segment_files = sorted(
+                (entry.name for entry in entries
+                 if entry.name.endswith('.ts') and entry.is_file()),
+                key=_segment_number
             )
-        logger.info(f"Uploaded playlist: {playlist_key}")
-
-        # Upload all segment files
-        segment_count = 0
-        for filename in os.listdir(local_dir):
-            if filename.endswith('.ts'):
-                segment_path = os.path.join(local_dir, filename)
-                segment_key = f"{r2_prefix}/{filename}"
-
-                with open(segment_path, 'rb') as f:
-                    client.upload_fileobj(
-                        f,
-                        settings.r2_bucket_name,
-                        segment_key,
-                        ExtraArgs={'ContentType': 'video/mp2t'}
-                    )
-                segment_count += 1
-
-        logger.info(f"Uploaded {segment_count} HLS segments")
 
-        return playlist_key
+        # Upload all segment files concurrently on the shared client
+        with ThreadPoolExecutor(
+            max_workers=HLS_UPLOAD_CONCURRENCY,
+            thread_name_prefix="hls-upload"
+        ) as executor:
+            futures = [
+                executor.submit(_upload_segment, client, local_dir, r2_prefix, filename)
+                for filename in segment_files
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        logger.info(f"Uploaded {len(segment_files)} HLS segments")
+
+        # Upload playlist last so it never references a missing segment
+        return _upload_playlist(client, playlist_path, r2_prefix)
 
     except Exception as e:
         raise R2Error(f"Failed to upload HLS segments: {str(e)}")
@@ -178,30 +441,70 @@ def delete_hls_directory(r2_prefix: str) -> None:
     try:
         client = get_r2_client()
 
-        # List all objects with the prefix
-        response = client.list_objects_v2(
-            Bucket=settings.r2_bucket_name,
-            Prefix=r2_prefix
-        )
-
-        if 'Contents' not in response:
+        deleted_count = 0
+        with ThreadPoolExecutor(
+            max_workers=DELETE_CONCURRENCY,
+            thread_name_prefix="hls-delete"
+        ) as executor:
+            futures = [
+                executor.submit(_delete_batch, client, batch)
+                for batch in _batched(_iter_hls_keys(r2_prefix), DELETE_BATCH_SIZE)
+            ]
+            for future in as_completed(futures):
+                deleted_count += future.result()
+
+        if not deleted_count:
             logger.info(f"No HLS files found for prefix: {r2_prefix}")
             return
 
-        # Delete all objects
-        objects_to_delete = [{'Key': obj['Key']} for obj in response['Contents']]
-
-        client.delete_objects(
-            Bucket=settings.r2_bucket_name,
-            Delete={'Objects': objects_to_delete}
-        )
-
-        logger.info(f"Deleted {len(objects_to_delete)} HLS files from {r2_prefix}")
+        logger.info(f"Deleted {deleted_count} HLS files from {r2_prefix}")
 
     except Exception as e:
         raise R2Error(f"Failed to delete HLS directory: {str(e)}")
 
 
+@lru_cache(maxsize=1)
+def _list_paginator():
+    """Build the list_objects_v2 paginator once for the shared client."""
+    return get_r2_client().get_paginator('list_objects_v2')
+
+
+def _iter_hls_keys(r2_prefix: str) -> Iterator[str]:
+    """Yield every key under a prefix, following list pagination."""
+    pages = _list_paginator().paginate(
+        Bucket=settings.r2_bucket_name,
+        Prefix=r2_prefix,
+        PaginationConfig={'PageSize': DELETE_BATCH_SIZE}
+    )
+    for page in pages:
+        for obj in page.get('Contents', []):
+            yield obj['Key']
+
+
+def _batched(keys: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Group keys into lists of at most size items."""
+    batch = []
+    for key in keys:
+        batch.append(key)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _delete_batch(client, keys: list[str]) -> int:
+    """Delete up to 1000 keys in one request and return how many were removed."""
+    response = client.delete_objects(
+        Bucket=settings.r2_bucket_name,
+        Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+    )
+    errors = response.get('Errors')
+    if errors:
+        raise R2Error(f"Failed to delete {len(errors)} objects, first: {errors[0].get('Key')}")
+    return len(keys)
+
+
 def list_hls_files(r2_prefix: str) -> list[str]:
     """
     List all HLS files for a video in R2.
@@ -216,17 +519,7 @@ def list_hls_files(r2_prefix: str) -> list[str]:
         R2Error: If listing fails
     """
     try:
-        client = get_r2_client()
-
-        response = client.list_objects_v2(
-            Bucket=settings.r2_bucket_name,
-            Prefix=r2_prefix
-        )
-
-        if 'Contents' not in response:
-            return []
-
-        return [obj['Key'] for obj in response['Contents']]
+        return list(_iter_hls_keys(r2_prefix))
 
     except Exception as e:
         raise R2Error(f"Failed to list HLS files: {str(e)}")
@@ -258,52 +551,37 @@ def check_hls_exists(r2_playlist_key: str) -> bool:
 
 def get_hls_playlist_url(r2_playlist_key: str, expires_in: int = 3600) -> str:
     """
-    Generate presigned URL for HLS playlist.
+    Get a playback URL for an HLS playlist.
+
+    Shares get_stream_url's windowed cache, so a hot playlist is signed once
+    per window instead of on every request.
 
     Args:
         r2_playlist_key: R2 key of playlist.m3u8
-        expires_in: URL expiration time in seconds (default 1 hour)
+        expires_in: Minimum remaining validity in seconds (default 1 hour)
 
     Returns:
-        Presigned URL for playlist access
+        Presigned (or public) URL for playlist access
 
     Raises:
         R2Error: If URL generation fails
     """
-    try:
-        client = get_r2_client()
-
-        # If public URL is configured, use it
-        if settings.r2_public_url:
-            return f"{settings.r2_public_url.rstrip('/')}/{r2_playlist_key}"
-
-        # Otherwise generate presigned URL
-        url = client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': settings.r2_bucket_name,
-                'Key': r2_playlist_key
-            },
-            ExpiresIn=expires_in
-        )
-
-        return url
-
-    except Exception as e:
-        raise R2Error(f"Failed to generate HLS playlist URL: {str(e)}")
+    return get_stream_url(r2_playlist_key, expires_in=expires_in)
 
 
 def cleanup_hls_temp_files(temp_dir: str) -> None:
     """
     Clean up temporary HLS directory.
 
+    Entries that can't be removed are logged and skipped so one stuck file
+    doesn't leave the rest of the segments behind.
+
     Args:
         temp_dir: Path to temporary HLS directory
     """
-    try:
-        if os.path.exists(temp_dir):
-            import shutil
-            shutil.rmtree(temp_dir)
-            logger.info(f"Cleaned up HLS temp directory: {temp_dir}")
-    except Exception as e:
-        logger.warning(f"Failed to clean up HLS temp directory {temp_dir}: {str(e)}")
+    def log_error(func, path, exc_info) -> None:
+        if not issubclass(exc_info[0], FileNotFoundError):
+            logger.warning(f"Failed to remove {path} during HLS cleanup: {exc_info[1]}")
+
+    shutil.rmtree(temp_dir, onerror=log_error)
+    logger.info(f"Cleaned up HLS temp directory: {temp_dir}")
@@ -1,9 +1,13 @@
 """LiteLLM service for structured LLM interactions."""
 
-import json
+import asyncio
 import logging
-from typing import Any, List, Optional, Type, TypeVar, Union
+import random
+from importlib.util import find_spec
+from typing import Any, AsyncIterator, List, Optional, Type, TypeVar, Union
 
+import httpx
+import litellm
 from litellm import acompletion
 from pydantic import BaseModel, ValidationError
 
@@ -13,6 +17,55 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# HTTP/2 needs the optional h2 package; without it the pool still reuses
+# keep-alive HTTP/1.1 connections across concurrent requests
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Retry spacing for transient provider errors: 0.5s, 1s, 2s... capped at 30s
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 30.0
+RETRY_JITTER_SECONDS = 0.5
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Retry throttling, server errors and connection failures; not 4xx."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        return True  # Timeouts and connection errors carry no status
+    return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt, honoring Retry-After."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        retry_after = float(headers.get("retry-after"))
+        return min(RETRY_MAX_SECONDS, max(0.0, retry_after))
+    except (TypeError, ValueError):
+        pass
+    backoff = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt)
+    return backoff + random.uniform(0, RETRY_JITTER_SECONDS)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client shared by all LiteLLM async calls.
+
+    Returns:
+        Pooled httpx.AsyncClient (HTTP/2 when available)
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(120.0),
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+    return _http_client
+
 
 class LLMService:
     """Service for interacting with LLMs via LiteLLM."""
@@ -34,6 +87,10 @@ class LLMService:
         self.temperature = temperature
         self.max_tokens = max_tokens
 
+        # Concurrent chats share pooled connections instead of a handshake each
+        if litellm.aclient_session is None:
+            litellm.aclient_session = _get_http_client()
+
     async def chat(
         self,
         messages: List[dict[str, str]],
@@ -42,8 +99,9 @@ class LLMService:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         max_retries: int = 3,
+        stream: bool = False,
         **kwargs: Any,
-    ) -> Union[str, T]:
+    ) -> Union[str, T, AsyncIterator[str]]:
         """Send chat completion request with optional structured output.
 
         Args:
@@ -52,10 +110,15 @@ class LLMService:
             temperature: Override default temperature
             max_tokens: Override default max_tokens
             max_retries: Number of retry attempts on failure
+            stream: Stream tokens from the provider. With a response_model the
+                streamed JSON is accumulated and validated once at the end;
+                without one, an async iterator of content deltas is returned
+                (not retried once iteration has started)
             **kwargs: Additional arguments passed to litellm.acompletion
 
         Returns:
-            String content if no response_model, otherwise parsed Pydantic model instance
+            String content (or an async iterator of deltas when streaming) if no
+            response_model, otherwise parsed Pydantic model instance
 
         Raises:
             ValidationError: If response doesn't match response_model schema
@@ -79,6 +142,9 @@ class LLMService:
         if response_model:
             request_args["response_format"] = response_model
 
+        if stream:
+            request_args["stream"] = True
+
         # Execute with retries
         last_error = None
         for attempt in range(max_retries):
@@ -93,6 +159,12 @@ class LLMService:
 
                 response = await acompletion(**request_args)
 
+                if stream:
+                    if not response_model:
+                        return self._iter_content(response)
+                    content = "".join([delta async for delta in self._iter_content(response)])
+                    return self._parse_content(content, response_model)
+
                 # Parse structured response if model provided
                 if response_model:
                     return self._parse_response(response, response_model)
@@ -101,10 +173,8 @@ class LLMService:
 
             except ValidationError as e:
                 logger.warning(
-                    "litellm_validation_error",
-                    error=str(e),
-                    attempt=attempt + 1,
-                    model_name=response_model.__name__ if response_model else None,
+                    f"litellm_validation_error: {response_model.__name__} "
+                    f"(attempt {attempt + 1}): {e}"
                 )
                 last_error = e
 
@@ -115,15 +185,14 @@ class LLMService:
 
             except Exception as e:
                 logger.error(
-                    "litellm_request_failed",
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    attempt=attempt + 1,
+                    f"litellm_request_failed: {type(e).__name__}: {e} "
+                    f"(attempt {attempt + 1})"
                 )
                 last_error = e
 
-                # Retry on transient errors
-                if attempt < max_retries - 1:
+                # Back off on transient errors; fail fast on bad requests and auth
+                if attempt < max_retries - 1 and _is_retryable(e):
+                    await asyncio.sleep(_retry_delay(e, attempt))
                     continue
                 raise
 
@@ -136,7 +205,7 @@ class LLMService:
         """Parse response into Pydantic model.
 
         LiteLLM supports native Pydantic parsing via response.choices[0].message.parsed.
-        Falls back to manual JSON parsing if parsed attribute not available.
+        Falls back to manual JSON parsing if parsed is missing or None.
 
         Args:
             response: LiteLLM response object
@@ -148,32 +217,49 @@ class LLMService:
         Raises:
             ValidationError: If content doesn't match schema
         """
-        logger.debug("parsing_response", model_name=response_model.__name__)
-
-        try:
-            # Try native LiteLLM parsed response first
-            return response.choices[0].message.parsed
-        except AttributeError:
-            # Fallback to manual parsing
-            content = response.choices[0].message.content
-
-            # Strip markdown code fences if present
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
+        logger.debug(f"parsing_response: {response_model.__name__}")
 
-            try:
-                data = json.loads(content)
-                return response_model.model_validate(data)
-            except json.JSONDecodeError as e:
-                logger.error(
-                    "json_decode_error",
-                    content=content[:200],
-                    error=str(e),
-                )
-                raise ValidationError(f"Invalid JSON response: {e}") from e
+        message = response.choices[0].message
+
+        # Native LiteLLM parsed response first; None means the provider didn't parse
+        parsed = getattr(message, "parsed", None)
+        if parsed is not None:
+            if isinstance(parsed, response_model):
+                return parsed
+            return response_model.model_validate(parsed)
+
+        # Fallback to manual parsing
+        return self._parse_content(message.content, response_model)
+
+    @staticmethod
+    def _parse_content(content: str, response_model: Type[T]) -> T:
+        """Validate raw JSON content, stripping markdown code fences if present.
+
+        Args:
+            content: Message content returned by the model
+            response_model: Pydantic model class
+
+        Returns:
+            Parsed model instance
+
+        Raises:
+            ValidationError: If content is not valid JSON or doesn't match schema
+        """
+        content = content.strip().removeprefix("```json").removesuffix("```")
+
+        # Validates straight from JSON text; malformed JSON surfaces as a
+        # ValidationError (json_invalid) and is retried by chat()
+        return response_model.model_validate_json(content.strip())
+
+    @staticmethod
+    async def _iter_content(response: Any) -> AsyncIterator[str]:
+        """Yield non-empty content deltas from a streamed completion."""
+        async for chunk in response:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
 
 
 # Singleton instance for convenience
@@ -197,13 +283,13 @@ async def chat(
     *,
     response_model: Optional[Type[T]] = None,
     **kwargs: Any,
-) -> Union[str, T]:
+) -> Union[str, T, AsyncIterator[str]]:
     """Convenience function for chat completion.
 
     Args:
         messages: List of message dicts with 'role' and 'content'
         response_model: Optional Pydantic model for structured responses
-        **kwargs: Additional arguments (temperature, max_tokens, etc.)
+        **kwargs: Additional arguments (temperature, max_tokens, stream, etc.)
 
     Returns:
         String content if no response_model, otherwise parsed Pydantic model instance
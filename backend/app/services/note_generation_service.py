@@ -1,48 +1,19 @@
+import hashlib
+import time
+from collections import OrderedDict
+
 from loguru import logger
 from app.config import settings
 from app.schemas import GeneratedNote
 from app.services.llm import chat
 
 
-class NoteGenerationError(Exception):
-    """Raised when note generation fails."""
-
-    pass
-
-
-async def generate_notes(
-    transcript_text: str,
-    transcript_segments: list[dict] = None,
-    model: str = None
-) -> tuple[GeneratedNote, str]:
-    """
-    Generate structured notes from transcript with timestamp references using LiteLLM.
-
-    Args:
-        transcript_text: Transcribed text to generate notes from
-        transcript_segments: Optional timestamped segments from Whisper API
-        model: Model to use for note generation (defaults to settings.notes_model)
-
-    Returns:
-        tuple: (GeneratedNote object, model_used)
-
-    Raises:
-        NoteGenerationError: If note generation fails
-    """
-    if not transcript_text or not transcript_text.strip():
-        raise NoteGenerationError("Cannot generate notes from empty transcript")
+# Static prompt pieces; only the transcript and timestamp mode vary per call
+_PROMPT_HEADER = """Generate comprehensive, structured notes from the following transcript.
 
-    # Use configured model if not specified
-    if model is None:
-        model = settings.notes_model
+"""
 
-    # Format transcript with timestamps if available
-    if transcript_segments:
-        formatted_transcript = "\n".join([
-            f"[{segment['start']:.1f}s - {segment['end']:.1f}s] {segment['text']}"
-            for segment in transcript_segments
-        ])
-        timestamp_instruction = """
+_TIMESTAMP_INSTRUCTION_WITH = """
 IMPORTANT: For key_points, takeaways, and quotes, you MUST include timestamp references.
 Use the timestamp from the segment where the content appears (look for [X.Xs - Y.Ys] markers).
 For each item, include the timestamp_seconds field with the start time of the relevant segment.
@@ -52,16 +23,13 @@ Example format:
 - takeaways: [{"content": "Important insight", "timestamp_seconds": 120.5}]
 - quotes: [{"content": "Direct quote", "timestamp_seconds": 78.3}]
 """
-    else:
-        formatted_transcript = transcript_text
-        timestamp_instruction = """
+
+_TIMESTAMP_INSTRUCTION_WITHOUT = """
 Note: Timestamp data is not available for this transcript.
 For key_points, takeaways, and quotes, set timestamp_seconds to null.
 """
 
-    note_prompt = f"""Generate comprehensive, structured notes from the following transcript.
-
-{timestamp_instruction}
+_PROMPT_BODY = """
 
 Extract and organize the following information:
 - Title: Concise, descriptive title for the video (5-10 words max)
@@ -90,7 +58,101 @@ Extract and organize the following information:
 - Actionable Insights: 3-5 clinical, professional, or educational recommendations (plain strings)
 
 Transcript:
-{formatted_transcript}"""
+"""
+
+
+# Notes for recently seen prompts, keyed by blake2b(model + prompt). Retries
+# after a crash and repeated processing of the same transcript reuse the
+# result instead of paying for another LLM call. Only touched from the event
+# loop thread, so no lock is needed.
+_NOTES_CACHE_MAX_SIZE = 256
+_NOTES_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_notes_cache: "OrderedDict[bytes, tuple[GeneratedNote, float]]" = OrderedDict()
+
+
+def _notes_cache_key(model: str, prompt: str) -> bytes:
+    """Hash the model and full prompt; blake2b is cheap on long transcripts."""
+    return hashlib.blake2b(
+        f"{model}\0{prompt}".encode(), digest_size=16
+    ).digest()
+
+
+def _cached_notes(key: bytes) -> GeneratedNote | None:
+    """Return cached notes for a key, or None if absent or expired."""
+    entry = _notes_cache.get(key)
+    if entry is None:
+        return None
+    notes, expires_at = entry
+    if expires_at <= time.time():
+        del _notes_cache[key]
+        return None
+    _notes_cache.move_to_end(key)
+    return notes
+
+
+def _remember_notes(key: bytes, notes: GeneratedNote) -> None:
+    """Cache notes, evicting the oldest entry when full."""
+    _notes_cache[key] = (notes, time.time() + _NOTES_CACHE_TTL_SECONDS)
+    _notes_cache.move_to_end(key)
+    if len(_notes_cache) > _NOTES_CACHE_MAX_SIZE:
+        _notes_cache.popitem(last=False)
+
+
+class NoteGenerationError(Exception):
+    """Raised when note generation fails."""
+
+    pass
+
+
+async def generate_notes(
+    transcript_text: str,
+    transcript_segments: list[dict] = None,
+    model: str = None,
+    cache: bool = True
+) -> tuple[GeneratedNote, str]:
+    """
+    Generate structured notes from transcript with timestamp references using LiteLLM.
+
+    Args:
+        transcript_text: Transcribed text to generate notes from
+        transcript_segments: Optional timestamped segments from Whisper API
+        model: Model to use for note generation (defaults to settings.notes_model)
+        cache: Reuse notes previously generated for an identical prompt and model
+
+    Returns:
+        tuple: (GeneratedNote object, model_used)
+
+    Raises:
+        NoteGenerationError: If note generation fails
+    """
+    if not transcript_text or not transcript_text.strip():
+        raise NoteGenerationError("Cannot generate notes from empty transcript")
+
+    # Use configured model if not specified
+    if model is None:
+        model = settings.notes_model
+
+    # Format transcript with timestamps if available
+    if transcript_segments:
+        formatted_transcript = "\n".join(
+            f"[{segment['start']:.1f}s - {segment['end']:.1f}s] {segment['text']}"
+            for segment in transcript_segments
+        )
+        timestamp_instruction = _TIMESTAMP_INSTRUCTION_WITH
+    else:
+        formatted_transcript = transcript_text
+        timestamp_instruction = _TIMESTAMP_INSTRUCTION_WITHOUT
+
+    note_prompt = "".join(
+        (_PROMPT_HEADER, timestamp_instruction, _PROMPT_BODY, formatted_transcript)
+    )
+
+    cache_key = _notes_cache_key(model, note_prompt)
+    if cache:
+        cached = _cached_notes(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached notes for identical transcript")
+            return cached, model
 
     try:
         note_object = await chat(
@@ -101,6 +163,8 @@ Transcript:
         if not note_object:
             raise NoteGenerationError("Empty notes returned")
 
+        _remember_notes(cache_key, note_object)
+
         return note_object, model
 
     except Exception as e:
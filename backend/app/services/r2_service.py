@@ -1,14 +1,82 @@
 """Cloudflare R2 storage service for video uploads."""
 import os
+import time
 import uuid
+import asyncio
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import BinaryIO, Optional
+from typing import AsyncIterator, Optional
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from loguru import logger
 
 from app.config import settings
+from app.utils.scratch import get_scratch_dir
+
+
+# Part size for upload_stream's manual multipart upload
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Multipart settings for upload_local_file:
+# parts above the threshold are PUT concurrently from transfer threads
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=settings.r2_multipart_threshold_mb * 1024 * 1024,
+    multipart_chunksize=settings.r2_multipart_chunksize_mb * 1024 * 1024,
+    max_concurrency=settings.r2_upload_concurrency,
+    use_threads=True
+)
+
+# Ranged GETs for source downloads: 16MB parts, capped at 8 streams since R2
+# has returned SignatureDoesNotMatch under heavier part concurrency
+DOWNLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# HLS segments are already uploaded from a thread pool and are almost always
+# under the threshold, so each transfer stays a single PUT on the caller's thread
+SEGMENT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=False
+)
+
+
+# One client is shared process-wide (boto3 clients are thread-safe). The pool
+# is sized for concurrent presigning, part uploads and HLS segment transfers;
+# signature_version pins SigV4 so the signer isn't resolved per request.
+# Bodies go over TLS with a CRC32 checksum (zlib, the botocore default), so
+# the SigV4 SHA-256 of every uploaded payload is skipped.
+R2_CLIENT_CONFIG = Config(
+    signature_version='s3v4',
+    max_pool_connections=128,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    tcp_keepalive=True,
+    request_checksum_calculation='when_supported',
+    s3={'payload_signing_enabled': False}
+)
+
+# Shared pool for multipart part uploads driven from async code (upload_stream)
+_part_upload_executor = ThreadPoolExecutor(
+    max_workers=(os.cpu_count() or 1) * 2,
+    thread_name_prefix="r2-part-upload"
+)
+MAX_PARTS_IN_FLIGHT = 8  # Bounds buffered memory to ~64MB per upload
+
+# Stream URLs are reused within fixed windows so polling clients get a stable URL
+STREAM_URL_BUCKET_SECONDS = 600
+
+
+# Dedicated session: boto3's implicit default session is created lazily and
+# is not safe to initialise from several threads at once
+_R2_SESSION = boto3.session.Session()
 
 
 class R2Error(Exception):
@@ -16,9 +84,13 @@ class R2Error(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
 def get_r2_client():
     """
-    Create and return boto3 S3 client configured for Cloudflare R2.
+    Return the shared boto3 S3 client configured for Cloudflare R2.
+
+    The client is created on first use and reused for the life of the
+    process, so TLS connections and signer setup are not repeated per call.
 
     Returns:
         boto3 S3 client instance
@@ -38,85 +110,145 @@ def get_r2_client():
         )
 
     try:
-        client = boto3.client(
+        client = _R2_SESSION.client(
             's3',
             endpoint_url=settings.r2_endpoint_url,
             aws_access_key_id=settings.r2_access_key_id,
             aws_secret_access_key=settings.r2_secret_access_key,
-            region_name='auto'  # R2 uses 'auto' for region
+            region_name='auto',  # R2 uses 'auto' for region
+            config=R2_CLIENT_CONFIG
         )
         return client
     except Exception as e:
         raise R2Error(f"Failed to create R2 client: {str(e)}")
 
 
-def upload_video(
-    file_obj: BinaryIO,
+def build_video_key(filename: str, user_id: Optional[str] = None) -> str:
+    """Generate a unique R2 key for a video, grouped by user when known."""
+    file_ext = Path(filename).suffix
+    unique_id = uuid.uuid4()
+
+    if user_id:
+        return f"videos/{user_id}/{unique_id}{file_ext}"
+    return f"videos/{unique_id}{file_ext}"
+
+
+async def upload_stream(
+    chunks: AsyncIterator[bytes],
+    r2_key: str,
     filename: str,
-    user_id: Optional[str] = None,
     content_type: str = "video/mp4"
-) -> tuple[str, int]:
+) -> int:
     """
-    Upload video file to R2 bucket.
+    Upload a byte stream to R2 as a multipart upload while it is being read.
+
+    Incoming chunks are re-buffered into 8MB parts; each part is sent from a
+    shared thread pool as soon as it fills, so reading and uploading overlap.
+    At most MAX_PARTS_IN_FLIGHT parts are buffered at once. The multipart
+    upload is aborted if the stream or any part fails.
 
     Args:
-        file_obj: File object to upload (e.g., UploadFile.file or open file)
-        filename: Original filename
-        user_id: Optional user ID for organizing files
+        chunks: Async iterator of raw bytes (e.g. request/UploadFile reads)
+        r2_key: Destination R2 object key
+        filename: Original filename (stored as object metadata)
         content_type: MIME type of the video
 
     Returns:
-        Tuple of (r2_key, file_size_bytes)
+        Total bytes uploaded
 
     Raises:
-        R2Error: If upload fails
+        R2Error: If the upload fails (exceptions raised by `chunks` propagate unchanged)
     """
-    try:
-        client = get_r2_client()
-
-        # Generate unique R2 key
-        file_ext = Path(filename).suffix
-        unique_id = uuid.uuid4()
-
-        if user_id:
-            r2_key = f"videos/{user_id}/{unique_id}{file_ext}"
-        else:
-            r2_key = f"videos/{unique_id}{file_ext}"
+    client = get_r2_client()
+    loop = asyncio.get_running_loop()
 
-        logger.info(f"Uploading video to R2: {r2_key}")
+    def run(fn, **kwargs):
+        return loop.run_in_executor(_part_upload_executor, partial(fn, **kwargs))
 
-        # Upload file to R2
-        client.upload_fileobj(
-            file_obj,
-            settings.r2_bucket_name,
-            r2_key,
-            ExtraArgs={
-                'ContentType': content_type,
-                'Metadata': {
-                    'original_filename': filename
-                }
-            }
+    try:
+        upload = await run(
+            client.create_multipart_upload,
+            Bucket=settings.r2_bucket_name,
+            Key=r2_key,
+            ContentType=content_type,
+            Metadata={'original_filename': filename}
         )
+    except ClientError as e:
+        raise R2Error(f"R2 multipart upload could not start: {str(e)}")
+
+    upload_id = upload['UploadId']
+    in_flight: set = set()
+    parts = []
+    buffer = bytearray()
+    total_size = 0
+
+    async def send_part(data: bytes) -> None:
+        part_number = len(parts) + len(in_flight) + 1
+        future = asyncio.ensure_future(run(
+            client.upload_part,
+            Bucket=settings.r2_bucket_name,
+            Key=r2_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data
+        ))
+        future.part_number = part_number
+        in_flight.add(future)
+        if len(in_flight) >= MAX_PARTS_IN_FLIGHT:
+            await collect(asyncio.FIRST_COMPLETED)
+
+    async def collect(return_when) -> None:
+        done, _ = await asyncio.wait(in_flight, return_when=return_when)
+        for future in done:
+            in_flight.discard(future)
+            parts.append({'ETag': future.result()['ETag'], 'PartNumber': future.part_number})
 
-        # Get file size
-        response = client.head_object(
+    try:
+        logger.info(f"Streaming multipart upload to R2: {r2_key}")
+
+        async for chunk in chunks:
+            total_size += len(chunk)
+            buffer += chunk
+            while len(buffer) >= MULTIPART_CHUNK_SIZE:
+                await send_part(bytes(buffer[:MULTIPART_CHUNK_SIZE]))
+                del buffer[:MULTIPART_CHUNK_SIZE]
+
+        # Final (possibly short) part; S3 requires at least one part
+        if buffer or not (parts or in_flight):
+            await send_part(bytes(buffer))
+        if in_flight:
+            await collect(asyncio.ALL_COMPLETED)
+
+        parts.sort(key=lambda part: part['PartNumber'])
+        await run(
+            client.complete_multipart_upload,
             Bucket=settings.r2_bucket_name,
-            Key=r2_key
+            Key=r2_key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': parts}
         )
-        file_size = response['ContentLength']
-
-        logger.info(f"Upload complete: {r2_key} ({file_size} bytes)")
 
-        return r2_key, file_size
+        logger.info(f"Upload complete: {r2_key} ({total_size} bytes, {len(parts)} parts)")
+        return total_size
+
+    except BaseException as e:
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        try:
+            await run(
+                client.abort_multipart_upload,
+                Bucket=settings.r2_bucket_name,
+                Key=r2_key,
+                UploadId=upload_id
+            )
+        except Exception as abort_error:
+            logger.warning(f"Failed to abort multipart upload {r2_key}: {str(abort_error)}")
 
-    except ClientError as e:
-        error_msg = f"R2 upload failed: {str(e)}"
-        logger.error(error_msg)
-        raise R2Error(error_msg)
-    except Exception as e:
-        error_msg = f"Unexpected error during R2 upload: {str(e)}"
-        logger.error(error_msg)
-        raise R2Error(error_msg)
+        if isinstance(e, ClientError):
+            error_msg = f"R2 upload failed: {str(e)}"
+            logger.error(error_msg)
+            raise R2Error(error_msg)
+        raise
 
 
 def upload_local_file(
@@ -138,15 +270,41 @@ def upload_local_file(
     Raises:
         R2Error: If file doesn't exist or upload fails
     """
-    if not os.path.exists(local_path):
+    try:
+        file_size = os.path.getsize(local_path)
+    except OSError:
         raise R2Error(f"Local file not found: {local_path}")
 
     try:
-        with open(local_path, 'rb') as f:
-            filename = Path(local_path).name
-            return upload_video(f, filename, user_id, content_type)
-    except R2Error:
-        raise
+        client = get_r2_client()
+        filename = Path(local_path).name
+        r2_key = build_video_key(filename, user_id)
+
+        logger.info(f"Uploading local file to R2: {r2_key}")
+
+        # upload_file reads parts by offset from its own file handles, so
+        # parts are read and PUT in parallel; the size is already known
+        client.upload_file(
+            local_path,
+            settings.r2_bucket_name,
+            r2_key,
+            ExtraArgs={
+                'ContentType': content_type,
+                'Metadata': {
+                    'original_filename': filename
+                }
+            },
+            Config=UPLOAD_TRANSFER_CONFIG
+        )
+
+        logger.info(f"Upload complete: {r2_key} ({file_size} bytes)")
+
+        return r2_key, file_size
+
+    except ClientError as e:
+        error_msg = f"R2 upload failed: {str(e)}"
+        logger.error(error_msg)
+        raise R2Error(error_msg)
     except Exception as e:
         raise R2Error(f"Failed to upload local file: {str(e)}")
 
@@ -174,7 +332,8 @@ def download_video(r2_key: str, destination_path: Optional[str] = None) -> tuple
             temp_file = tempfile.NamedTemporaryFile(
                 delete=False,
                 suffix=file_ext,
-                prefix="r2_download_"
+                prefix="r2_download_",
+                dir=get_scratch_dir(settings.max_file_size_bytes)
             )
             destination_path = temp_file.name
             temp_file.close()
@@ -185,7 +344,8 @@ def download_video(r2_key: str, destination_path: Optional[str] = None) -> tuple
         client.download_file(
             settings.r2_bucket_name,
             r2_key,
-            destination_path
+            destination_path,
+            Config=DOWNLOAD_TRANSFER_CONFIG
         )
 
         # Get file size
@@ -282,6 +442,36 @@ def get_video_url(r2_key: str, expires_in: int = 3600) -> str:
         raise R2Error(error_msg)
 
 
+def get_stream_url(r2_key: str, expires_in: int = 3600) -> str:
+    """
+    Get a playback URL for a video, stable within a 10-minute window.
+
+    Repeated calls in the same window return the identical URL, so browsers
+    and CDNs can cache the video bytes and cache hits skip request signing.
+    Every returned URL stays valid for at least `expires_in` seconds.
+
+    Args:
+        r2_key: R2 object key
+        expires_in: Minimum remaining validity in seconds (default 1 hour)
+
+    Returns:
+        Presigned (or public) URL for video access
+
+    Raises:
+        R2Error: If URL generation fails
+    """
+    now = int(time.time())
+    bucket_start = now - (now % STREAM_URL_BUCKET_SECONDS)
+    return _stream_url_for_bucket(r2_key, bucket_start, expires_in)
+
+
+@lru_cache(maxsize=4096)
+def _stream_url_for_bucket(r2_key: str, bucket_start: int, expires_in: int) -> str:
+    """Sign once per (key, window); expiry is pinned to the window end + expires_in."""
+    expires_at = bucket_start + STREAM_URL_BUCKET_SECONDS + expires_in
+    return get_video_url(r2_key, expires_in=expires_at - int(time.time()))
+
+
 def generate_presigned_upload_url(
     r2_key: str,
     content_type: str = "video/mp4",
@@ -329,6 +519,127 @@ def generate_presigned_upload_url(
         raise R2Error(error_msg)
 
 
+def create_presigned_multipart_upload(
+    r2_key: str,
+    file_size: int,
+    content_type: str = "video/mp4",
+    expires_in: int = 3600
+) -> tuple[str, int, list[dict]]:
+    """
+    Start a multipart upload and presign one PUT URL per part.
+
+    The client uploads parts straight to R2 in parallel and then reports the
+    returned ETags to complete_multipart_upload.
+
+    Args:
+        r2_key: R2 object key where file will be stored
+        file_size: Total size of the file in bytes
+        content_type: MIME type of the file
+        expires_in: URL expiration time in seconds (default 1 hour)
+
+    Returns:
+        Tuple of (upload_id, part_size_bytes, parts) where parts is a list of
+        {"part_number": n, "url": presigned_url}
+
+    Raises:
+        R2Error: If the upload cannot be created or URLs cannot be signed
+    """
+    try:
+        client = get_r2_client()
+
+        response = client.create_multipart_upload(
+            Bucket=settings.r2_bucket_name,
+            Key=r2_key,
+            ContentType=content_type
+        )
+        upload_id = response['UploadId']
+
+        # R2 requires equal-sized parts (all but the last) of at least 5MiB
+        part_size = settings.r2_multipart_chunksize_mb * 1024 * 1024
+        part_count = -(-file_size // part_size)
+
+        # Presigning is local HMAC work, no request per part
+        parts = [
+            {
+                "part_number": part_number,
+                "url": client.generate_presigned_url(
+                    'upload_part',
+                    Params={
+                        'Bucket': settings.r2_bucket_name,
+                        'Key': r2_key,
+                        'UploadId': upload_id,
+                        'PartNumber': part_number
+                    },
+                    ExpiresIn=expires_in
+                )
+            }
+            for part_number in range(1, part_count + 1)
+        ]
+
+        logger.info(f"Created multipart upload for {r2_key}: {part_count} parts of {part_size} bytes")
+
+        return upload_id, part_size, parts
+
+    except ClientError as e:
+        error_msg = f"Failed to create multipart upload: {str(e)}"
+        logger.error(error_msg)
+        raise R2Error(error_msg)
+    except Exception as e:
+        error_msg = f"Unexpected error creating multipart upload: {str(e)}"
+        logger.error(error_msg)
+        raise R2Error(error_msg)
+
+
+def complete_multipart_upload(r2_key: str, upload_id: str, parts: list[dict]) -> None:
+    """
+    Assemble a client-uploaded multipart upload into the final object.
+
+    Args:
+        r2_key: R2 object key of the upload
+        upload_id: Upload ID returned by create_presigned_multipart_upload
+        parts: List of {"part_number": n, "etag": etag} reported by the client
+
+    Raises:
+        R2Error: If R2 rejects the part list
+    """
+    try:
+        client = get_r2_client()
+        client.complete_multipart_upload(
+            Bucket=settings.r2_bucket_name,
+            Key=r2_key,
+            UploadId=upload_id,
+            MultipartUpload={
+                'Parts': [
+                    {'ETag': part['etag'], 'PartNumber': part['part_number']}
+                    for part in sorted(parts, key=lambda p: p['part_number'])
+                ]
+            }
+        )
+        logger.info(f"Completed multipart upload for {r2_key} ({len(parts)} parts)")
+    except Exception as e:
+        error_msg = f"Failed to complete multipart upload: {str(e)}"
+        logger.error(error_msg)
+        raise R2Error(error_msg)
+
+
+def abort_multipart_upload(r2_key: str, upload_id: str) -> None:
+    """
+    Abort a multipart upload so R2 discards its stored parts (best-effort).
+
+    Args:
+        r2_key: R2 object key of the upload
+        upload_id: Upload ID to abort
+    """
+    try:
+        get_r2_client().abort_multipart_upload(
+            Bucket=settings.r2_bucket_name,
+            Key=r2_key,
+            UploadId=upload_id
+        )
+    except Exception as e:
+        logger.warning(f"Failed to abort multipart upload {r2_key}: {str(e)}")
+
+
 def verify_r2_object_exists(r2_key: str) -> bool:
     """
     Verify that an object exists in R2.
@@ -1,7 +1,9 @@
 import os
 import asyncio
+from pathlib import Path
+from typing import Any, Optional
 from loguru import logger
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from app.config import settings
 
 
@@ -11,12 +13,52 @@ class TranscriptionError(Exception):
     pass
 
 
-def transcribe_audio(audio_path: str, model: str = None) -> tuple[str, str, list[dict]]:
+# Shared async client: one connection pool serves every concurrent chunk request
+_async_client: Optional[AsyncOpenAI] = None
+
+
+def _get_async_client() -> AsyncOpenAI:
+    """Get or create the process-wide AsyncOpenAI client."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(api_key=settings.openai_api_key)
+    return _async_client
+
+
+def _parse_transcription(response: Any) -> tuple[str, list[dict]]:
+    """
+    Extract text and timestamped segments from a verbose_json response.
+
+    Raises:
+        TranscriptionError: If the transcript is empty
+    """
+    transcript_text = response.text
+
+    if not transcript_text:
+        raise TranscriptionError("Empty transcript returned")
+
+    # Parse segments with timestamps
+    segments = []
+    if hasattr(response, 'segments') and response.segments:
+        segments = [
+            {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text.strip()
+            }
+            for segment in response.segments
+        ]
+        logger.info(f"[TRANSCRIPTION] Extracted {len(segments)} timestamped segments")
+
+    return transcript_text, segments
+
+
+def transcribe_audio(audio_path: str | bytes, model: str = None) -> tuple[str, str, list[dict]]:
     """
     Transcribe audio file using OpenAI native API with timestamp extraction.
 
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file, or in-memory MP3 bytes
         model: Model to use for transcription (defaults to settings.transcription_model)
 
     Returns:
@@ -26,55 +68,49 @@ def transcribe_audio(audio_path: str, model: str = None) -> tuple[str, str, list
     Raises:
         TranscriptionError: If transcription fails
     """
-    if not os.path.exists(audio_path):
+    in_memory = isinstance(audio_path, bytes)
+    if not in_memory and not os.path.exists(audio_path):
         raise TranscriptionError(f"Audio file not found: {audio_path}")
+    audio_label = f"<{len(audio_path)} bytes in memory>" if in_memory else audio_path
 
     # Use configured model if not specified
     if model is None:
         model = settings.transcription_model
 
     logger.info(
-        f"[TRANSCRIPTION] Transcribing audio file {audio_path} with model {model}"
+        f"[TRANSCRIPTION] Transcribing audio file {audio_label} with model {model}"
     )
     # Initialize OpenAI client with API key
     client = OpenAI(api_key=settings.openai_api_key)
 
+    def create_transcription(audio_file):
+        logger.info(
+            f"[TRANSCRIPTION] Creating transcription request with model {model}"
+        )
+        response = client.audio.transcriptions.create(
+            model=model,
+            file=audio_file,
+            response_format="verbose_json",
+            timestamp_granularities=["segment"]
+        )
+        logger.info(f"[TRANSCRIPTION] Transcription request created")
+        return response
+
     try:
-        with open(audio_path, "rb") as audio_file:
-            logger.info(
-                f"[TRANSCRIPTION] Creating transcription request with model {model}"
-            )
-            response = client.audio.transcriptions.create(
-                model=model,
-                file=audio_file,
-                response_format="verbose_json",
-                timestamp_granularities=["segment"]
-            )
-            logger.info(f"[TRANSCRIPTION] Transcription request created")
+        if in_memory:
+            # Filename tells the API the container format
+            response = create_transcription(("audio.mp3", audio_path))
+        else:
+            with open(audio_path, "rb") as audio_file:
+                response = create_transcription(audio_file)
 
         # Extract text and segments from verbose response
-        transcript_text = response.text
-
-        if not transcript_text:
-            raise TranscriptionError("Empty transcript returned")
-
-        # Parse segments with timestamps
-        segments = []
-        if hasattr(response, 'segments') and response.segments:
-            segments = [
-                {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip()
-                }
-                for segment in response.segments
-            ]
-            logger.info(f"[TRANSCRIPTION] Extracted {len(segments)} timestamped segments")
+        transcript_text, segments = _parse_transcription(response)
 
         return transcript_text, model, segments
 
     except Exception as e:
-        logger.error(f"[TRANSCRIPTION] Error transcribing audio file {audio_path}: {e}")
+        logger.error(f"[TRANSCRIPTION] Error transcribing audio file {audio_label}: {e}")
         # Try fallback model if primary fails
         if (
             model == settings.transcription_model
@@ -91,6 +127,72 @@ def transcribe_audio(audio_path: str, model: str = None) -> tuple[str, str, list
         raise TranscriptionError(f"Transcription failed: {error_msg}")
 
 
+async def transcribe_audio_async(
+    audio_path: str | bytes, model: str = None
+) -> tuple[str, str, list[dict]]:
+    """
+    Transcribe audio on the shared AsyncOpenAI client without a worker thread.
+
+    Args:
+        audio_path: Path to audio file, or in-memory MP3 bytes
+        model: Model to use for transcription (defaults to settings.transcription_model)
+
+    Returns:
+        tuple: (transcript_text, model_used, transcript_segments)
+
+    Raises:
+        TranscriptionError: If transcription fails
+    """
+    in_memory = isinstance(audio_path, bytes)
+    if not in_memory and not os.path.exists(audio_path):
+        raise TranscriptionError(f"Audio file not found: {audio_path}")
+    audio_label = f"<{len(audio_path)} bytes in memory>" if in_memory else audio_path
+
+    # Use configured model if not specified
+    if model is None:
+        model = settings.transcription_model
+
+    logger.info(
+        f"[TRANSCRIPTION] Transcribing audio file {audio_label} with model {model}"
+    )
+
+    try:
+        if in_memory:
+            # Filename tells the API the container format
+            audio_file = ("audio.mp3", audio_path)
+        else:
+            audio_bytes = await asyncio.to_thread(Path(audio_path).read_bytes)
+            audio_file = (Path(audio_path).name, audio_bytes)
+
+        response = await _get_async_client().audio.transcriptions.create(
+            model=model,
+            file=audio_file,
+            response_format="verbose_json",
+            timestamp_granularities=["segment"]
+        )
+
+        transcript_text, segments = _parse_transcription(response)
+
+        return transcript_text, model, segments
+
+    except Exception as e:
+        logger.error(f"[TRANSCRIPTION] Error transcribing audio file {audio_label}: {e}")
+        # Try fallback model if primary fails
+        if (
+            model == settings.transcription_model
+            and settings.transcription_fallback_model
+        ):
+            try:
+                return await transcribe_audio_async(
+                    audio_path, model=settings.transcription_fallback_model
+                )
+            except Exception:
+                pass  # Fall through to original error
+
+        error_msg = str(e)
+        raise TranscriptionError(f"Transcription failed: {error_msg}")
+
+
 async def transcribe_audio_chunks(
     chunks: list[tuple[str, int]], model: str = None, max_concurrent: int = 2
 ) -> tuple[str, str, list[dict]]:
@@ -131,12 +233,8 @@ async def transcribe_audio_chunks(
                 f"Starting transcription of chunk {chunk_index + 1}/{len(chunks)}"
             )
 
-            # Run sync transcribe_audio in executor
-            loop = asyncio.get_event_loop()
             try:
-                transcript, _, segments = await loop.run_in_executor(
-                    None, transcribe_audio, chunk_path, model
-                )
+                transcript, _, segments = await transcribe_audio_async(chunk_path, model)
                 logger.info(
                     f"Completed chunk {chunk_index + 1}/{len(chunks)}: {len(transcript)} chars, {len(segments)} segments"
                 )
@@ -145,40 +243,47 @@ async def transcribe_audio_chunks(
                 logger.error(f"Failed to transcribe chunk {chunk_index + 1}: {str(e)}")
                 raise
 
-    try:
-        logger.info(f"Creating {len(chunks)} tasks for transcription")
-        # Create tasks for all chunks
-        tasks = [
-            transcribe_chunk_async(i, chunk_path)
-            for i, (chunk_path, _) in enumerate(chunks)
-        ]
+    logger.info(f"Creating {len(chunks)} tasks for transcription")
+    tasks = [
+        asyncio.create_task(transcribe_chunk_async(i, chunk_path))
+        for i, (chunk_path, _) in enumerate(chunks)
+    ]
 
+    try:
         logger.info(
             f"Executing {len(tasks)} tasks with concurrency limit {max_concurrent}"
         )
-        # Execute with concurrency limit
-        results = await asyncio.gather(*tasks)
-
-        # Sort by chunk index
-        results.sort(key=lambda x: x[0])
-
-        # Combine transcripts and segments with cumulative time offset
-        combined_transcript = " ".join(transcript for _, transcript, _ in results)
+        # Chunks are stitched as soon as they can be placed in order, so the
+        # combine work overlaps with chunks still in flight and each result
+        # is released once appended
+        transcripts = []
         combined_segments = []
         time_offset = 0.0
+        completed: dict[int, tuple[str, list[dict]]] = {}
+        next_index = 0
+
+        for finished in asyncio.as_completed(tasks):
+            chunk_index, transcript, segments = await finished
+            completed[chunk_index] = (transcript, segments)
+
+            while next_index in completed:
+                transcript, segments = completed.pop(next_index)
+                transcripts.append(transcript)
+
+                # Adjust segment timestamps by cumulative offset
+                for segment in segments:
+                    combined_segments.append({
+                        "start": segment["start"] + time_offset,
+                        "end": segment["end"] + time_offset,
+                        "text": segment["text"]
+                    })
 
-        for _, transcript, segments in results:
-            # Adjust segment timestamps by cumulative offset
-            for segment in segments:
-                combined_segments.append({
-                    "start": segment["start"] + time_offset,
-                    "end": segment["end"] + time_offset,
-                    "text": segment["text"]
-                })
+                # Update offset based on last segment's end time
+                if segments:
+                    time_offset = combined_segments[-1]["end"]
+                next_index += 1
 
-            # Update offset based on last segment's end time
-            if segments:
-                time_offset = combined_segments[-1]["end"]
+        combined_transcript = " ".join(transcripts)
 
         logger.info(
             f"Combined transcript: {len(combined_transcript)} characters, {len(combined_segments)} segments from {len(chunks)} chunks"
@@ -187,5 +292,8 @@ async def transcribe_audio_chunks(
         return combined_transcript, model, combined_segments
 
     except Exception as e:
+        # Don't leave sibling chunks spending API quota on a failed job
+        for task in tasks:
+            task.cancel()
         error_msg = str(e)
         raise TranscriptionError(f"Chunked transcription failed: {error_msg}")
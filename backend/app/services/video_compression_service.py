@@ -2,9 +2,11 @@
 import os
 import subprocess
 import asyncio
-import tempfile
-from pathlib import Path
-from typing import Tuple
+import threading
+from collections import deque
+from contextlib import aclosing
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Tuple
 from loguru import logger
 
 
@@ -13,115 +15,340 @@ class VideoCompressionError(Exception):
     pass
 
 
-def compress_video(
+# Only the tail of FFmpeg's stderr is kept for error messages
+STDERR_TAIL_LINES = 200
+
+# Read size for compress_video_stream; upload_stream re-buffers into multipart parts
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Fragmented MP4 needs no seek back to write the moov atom, so it can go to a
+# pipe; empty_moov puts the header up front, as +faststart does for files
+FRAGMENTED_MP4_FLAGS = "frag_keyframe+empty_moov+default_base_moof"
+
+# Approximate H.264 bits per pixel per frame that libx264 lands on at each CRF.
+# Inputs already at or under this rate gain nothing from a re-encode.
+TARGET_BITS_PER_PIXEL = {
+    18: 0.15,
+    23: 0.10,
+    26: 0.07,
+    28: 0.06,
+    32: 0.04,
+}
+
+# Hardware H.264 encoders in order of preference (NVIDIA, Apple, Intel)
+HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_qsv")
+
+
+async def compress_video_stream(
     input_path: str,
-    output_path: str = None,
     crf: int = 28,
     max_resolution: Tuple[int, int] = (1280, 720),
     max_fps: int = 30,
     audio_bitrate: str = "128k",
-    preset: str = "veryfast"
-) -> Tuple[str, int]:
+    preset: str = "veryfast",
+    hw_accel: bool = False
+) -> AsyncIterator[bytes]:
     """
-    Compress video using FFmpeg with H.264 codec.
+    Compress video and yield the output as it is encoded.
 
-    Reduces file size by 70-80% while maintaining high quality suitable for viewing.
-    Uses CRF (Constant Rate Factor) for quality-based encoding.
+    FFmpeg writes fragmented MP4 to stdout, so a consumer such as
+    r2_service.upload_stream can upload parts while the encode is still
+    running and no output file touches disk. Inputs that already meet the
+    targets are remuxed with -c copy. A remux or hardware encode that fails
+    before producing output falls back to the next option, ending with
+    libx264. Close the
+    generator (e.g. contextlib.aclosing) so FFmpeg is killed if the
+    consumer stops early.
 
     Args:
         input_path: Path to input video file
-        output_path: Path for output file (creates temp file if not provided)
         crf: Constant Rate Factor (18-28 recommended, lower=better quality)
-             23 = high quality (~50-70% reduction)
-             26 = very good quality (~70-80% reduction)
-             28 = good quality (~80-85% reduction)
         max_resolution: Maximum (width, height) - scales down if larger
         max_fps: Maximum frame rate (reduces if higher)
-        audio_bitrate: Audio bitrate (128k is good quality)
-        preset: FFmpeg encoding preset (faster=quicker encoding, larger files)
-                ultrafast, superfast, veryfast, faster, fast, medium, slow, slower, veryslow
+        audio_bitrate: Audio bitrate
+        preset: libx264 encoding preset
+        hw_accel: Use a hardware H.264 encoder if FFmpeg has a working one
 
-    Returns:
-        Tuple of (output_file_path, compressed_file_size_bytes)
+    Yields:
+        Chunks of up to STREAM_CHUNK_SIZE bytes of MP4 output
 
     Raises:
-        VideoCompressionError: If compression fails
+        VideoCompressionError: If FFmpeg fails or times out
     """
-    try:
-        if not os.path.exists(input_path):
-            raise VideoCompressionError(f"Input file not found: {input_path}")
-
-        # Create output path if not provided
-        if not output_path:
-            input_ext = Path(input_path).suffix
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False,
-                suffix=f"_compressed{input_ext}",
-                prefix="compressed_"
+    if not os.path.exists(input_path):
+        raise VideoCompressionError(f"Input file not found: {input_path}")
+
+    deadline = asyncio.get_running_loop().time() + 1800  # 30-minute timeout
+
+    # Cheapest first; each later attempt only runs if the previous one
+    # failed before producing output
+    attempts: list[tuple[str, list[str]]] = []
+    if await asyncio.to_thread(_meets_targets, input_path, crf, max_resolution, max_fps):
+        logger.info(f"Input already meets compression targets, remuxing: {input_path}")
+        attempts.append(("Remux", ["-c", "copy"]))
+
+    encoder = await asyncio.to_thread(_detect_hw_encoder) if hw_accel else None
+    if encoder:
+        # Hardware encoders can reject inputs libx264 handles (odd sizes, pixel formats)
+        attempts.append((encoder, _encode_args(crf, max_resolution, max_fps, audio_bitrate, preset, encoder)))
+    attempts.append(("libx264", _encode_args(crf, max_resolution, max_fps, audio_bitrate, preset, None)))
+
+    for attempt, (label, output_args) in enumerate(attempts, start=1):
+        if label != "Remux":
+            logger.info(
+                f"Compressing video to stream: {input_path} (CRF={crf}, preset={preset}, "
+                f"encoder={label})"
             )
-            output_path = temp_file.name
-            temp_file.close()
-
-        logger.info(f"Compressing video: {input_path} → {output_path}")
-        logger.info(f"Settings: CRF={crf}, preset={preset}, max_res={max_resolution}, max_fps={max_fps}")
-
-        # Build FFmpeg command
-        max_width, max_height = max_resolution
-
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-i", input_path,
-            # Video codec: H.264 with CRF
-            "-c:v", "libx264",
-            "-crf", str(crf),
-            "-preset", preset,  # Encoding speed preset
-            # Scale down if larger than max resolution (maintains aspect ratio)
-            "-vf", f"scale='min({max_width},iw)':'min({max_height},ih)':force_original_aspect_ratio=decrease",
-            # Limit frame rate
-            "-r", str(max_fps),
-            # Audio codec: AAC
-            "-c:a", "aac",
-            "-b:a", audio_bitrate,
-            # Optimize for streaming
-            "-movflags", "+faststart",  # Move moov atom to beginning for faster streaming
-            # Overwrite output file
-            "-y",
-            output_path
-        ]
+        produced_output = False
+        try:
+            async with aclosing(_stream_ffmpeg(input_path, output_args, deadline)) as chunks:
+                async for chunk in chunks:
+                    produced_output = True
+                    yield chunk
+            return
+        except VideoCompressionError as e:
+            # Output already handed to the consumer can't be taken back
+            if produced_output or attempt == len(attempts):
+                raise
+            logger.warning(f"{label} failed before producing output, falling back: {str(e)}")
+
+
+async def _stream_ffmpeg(
+    input_path: str,
+    output_args: list[str],
+    deadline: float
+) -> AsyncIterator[bytes]:
+    """
+    Run FFmpeg with fragmented MP4 on stdout and yield it in chunks.
+
+    Args:
+        input_path: Path to input video file
+        output_args: Codec args placed between the input and the MP4 muxer
+        deadline: Event loop time after which FFmpeg is killed
+
+    Yields:
+        Chunks of up to STREAM_CHUNK_SIZE bytes of MP4 output
+
+    Raises:
+        VideoCompressionError: If FFmpeg fails or passes the deadline
+    """
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-nostats",
+        "-loglevel", "error",
+        "-i", input_path,
+        *output_args,
+        "-f", "mp4",
+        "-movflags", FRAGMENTED_MP4_FLAGS,
+        "pipe:1"
+    ]
+
+    process, reader, stderr_tail = _spawn_ffmpeg(ffmpeg_cmd, stdout=subprocess.PIPE)
+    loop = asyncio.get_running_loop()
+
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(
+                    asyncio.to_thread(process.stdout.read, STREAM_CHUNK_SIZE),
+                    timeout=max(0, deadline - loop.time())
+                )
+            except TimeoutError:
+                # Killing FFmpeg below closes the pipe and releases the blocked read
+                raise VideoCompressionError("Video compression timed out (>30 minutes)")
+            if not chunk:
+                break
+            yield chunk
+
+        returncode = await asyncio.to_thread(process.wait)
+        await asyncio.to_thread(reader.join)
+        if returncode != 0:
+            stderr_text = "\n".join(stderr_tail)
+            error_msg = f"FFmpeg compression failed: {stderr_text}"
+            logger.error(error_msg)
+            raise VideoCompressionError(error_msg)
+
+    finally:
+        if process.poll() is None:
+            process.kill()
+            await asyncio.to_thread(process.wait)
+        process.stdout.close()
+
+
+def _meets_targets(
+    input_path: str,
+    crf: int,
+    max_resolution: Tuple[int, int],
+    max_fps: int
+) -> bool:
+    """
+    Check whether an input is already H.264 within the compression targets.
+
+    The bitrate ceiling is TARGET_BITS_PER_PIXEL for the closest CRF, scaled
+    by the input's own resolution and frame rate.
+
+    Returns:
+        True if re-encoding would not meaningfully shrink the file
+    """
+    try:
+        info = get_video_info(input_path)
+    except VideoCompressionError:
+        return False
+
+    max_width, max_height = max_resolution
+    width, height = info['width'] or 0, info['height'] or 0
+    fps, bitrate = info['fps'], info['bitrate']
+
+    if info['codec'] != 'h264' or not (width and height and fps and bitrate):
+        return False
+    if width > max_width or height > max_height or fps > max_fps:
+        return False
+
+    closest_crf = min(TARGET_BITS_PER_PIXEL.keys(), key=lambda x: abs(x - crf))
+    target_bitrate = TARGET_BITS_PER_PIXEL[closest_crf] * width * height * fps
+    return bitrate <= target_bitrate
+
+
+@lru_cache(maxsize=1)
+def _detect_hw_encoder() -> Optional[str]:
+    """
+    Find a hardware H.264 encoder that actually works on this host.
 
-        # Run FFmpeg
-        logger.info(f"Running FFmpeg compression...")
+    Static FFmpeg builds list encoders like h264_nvenc even without the
+    hardware behind them, so each candidate is confirmed with a one-frame
+    test encode. The result is cached for the life of the process.
+
+    Returns:
+        Encoder name, or None to use libx264
+    """
+    try:
         result = subprocess.run(
-            ffmpeg_cmd,
+            ["ffmpeg", "-hide_banner", "-encoders"],
             capture_output=True,
             text=True,
-            timeout=1800  # 30-minute timeout
+            timeout=10
         )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
 
-        if result.returncode != 0:
-            error_msg = f"FFmpeg compression failed: {result.stderr}"
-            logger.error(error_msg)
-            raise VideoCompressionError(error_msg)
+    listed = {
+        fields[1]
+        for fields in (line.split() for line in result.stdout.splitlines())
+        if len(fields) >= 2
+    }
 
-        # Get output file size
-        if not os.path.exists(output_path):
-            raise VideoCompressionError(f"Output file not created: {output_path}")
+    for encoder in HW_ENCODERS:
+        if encoder not in listed:
+            continue
+        test_cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=size=256x256:rate=1",
+            "-frames:v", "1",
+            *_video_codec_args(28, "veryfast", encoder),
+            "-f", "null", "-"
+        ]
+        try:
+            probe = subprocess.run(test_cmd, capture_output=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if probe.returncode == 0:
+            logger.info(f"Using hardware video encoder: {encoder}")
+            return encoder
 
-        output_size = os.path.getsize(output_path)
-        input_size = os.path.getsize(input_path)
+    return None
 
-        reduction_pct = ((input_size - output_size) / input_size) * 100
-        logger.info(
-            f"Compression complete: {input_size / (1024*1024):.2f}MB → "
-            f"{output_size / (1024*1024):.2f}MB ({reduction_pct:.1f}% reduction)"
-        )
 
-        return output_path, output_size
+def _video_codec_args(crf: int, preset: str, encoder: Optional[str]) -> list[str]:
+    """
+    Build FFmpeg video codec args for the given encoder.
 
-    except subprocess.TimeoutExpired:
-        raise VideoCompressionError("Video compression timed out (>30 minutes)")
-    except Exception as e:
-        raise VideoCompressionError(f"Unexpected error during compression: {str(e)}")
+    Hardware encoders have no CRF, so each gets its closest
+    constant-quality mode at a similar quality level.
+
+    Args:
+        crf: libx264 CRF value
+        preset: libx264 preset, only used for the software path
+        encoder: Hardware encoder name, or None for libx264
+
+    Returns:
+        List of FFmpeg args starting with -c:v
+    """
+    if encoder == "h264_nvenc":
+        return ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", str(crf), "-b:v", "0",
+                "-pix_fmt", "yuv420p"]
+    if encoder == "h264_videotoolbox":
+        # -q:v runs 1-100 with higher meaning better; CRF 28 maps to ~46
+        quality = max(1, min(100, 2 * (51 - crf)))
+        return ["-c:v", "h264_videotoolbox", "-q:v", str(quality), "-pix_fmt", "yuv420p"]
+    if encoder == "h264_qsv":
+        return ["-c:v", "h264_qsv", "-preset", "veryfast", "-global_quality", str(crf),
+                "-pix_fmt", "nv12"]
+    return [
+        "-c:v", "libx264", "-crf", str(crf), "-preset", preset,
+        # Explicit auto threading; container CPU limits can fool x264's own detection
+        "-threads", "0",
+        # Cheaper decode for low-power clients, at a small size cost
+        "-tune", "fastdecode",
+        "-profile:v", "high", "-level", "4.1", "-pix_fmt", "yuv420p"
+    ]
+
+
+def _encode_args(
+    crf: int,
+    max_resolution: Tuple[int, int],
+    max_fps: int,
+    audio_bitrate: str,
+    preset: str,
+    encoder: Optional[str]
+) -> list[str]:
+    """Build the FFmpeg video and audio encoding args for compress_video_stream."""
+    max_width, max_height = max_resolution
+    return [
+        # Video codec: H.264, hardware encoder when available
+        *_video_codec_args(crf, preset, encoder),
+        # Scale down if larger than max resolution (maintains aspect ratio)
+        "-vf", f"scale='min({max_width},iw)':'min({max_height},ih)':force_original_aspect_ratio=decrease",
+        # Limit frame rate
+        "-r", str(max_fps),
+        # Fixed 2-second GOPs so the 6-second HLS segments cut cleanly on stream copy
+        "-g", str(2 * max_fps),
+        "-keyint_min", str(2 * max_fps),
+        "-sc_threshold", "0",
+        # Audio codec: AAC
+        "-c:a", "aac",
+        "-b:a", audio_bitrate,
+    ]
+
+
+def _spawn_ffmpeg(
+    ffmpeg_cmd: list[str],
+    stdout: int = subprocess.DEVNULL
+) -> tuple[subprocess.Popen, threading.Thread, deque]:
+    """
+    Start FFmpeg with stderr drained into a bounded ring buffer.
+
+    A reader thread consumes stderr line by line as FFmpeg writes it, so the
+    pipe never fills and memory stays bounded however long the encode runs.
+
+    Args:
+        ffmpeg_cmd: FFmpeg argv
+        stdout: Where FFmpeg's stdout goes (DEVNULL, or PIPE to read output)
+
+    Returns:
+        Tuple of (process, stderr reader thread, deque of the last
+        STDERR_TAIL_LINES stderr lines)
+    """
+    process = subprocess.Popen(ffmpeg_cmd, stdout=stdout, stderr=subprocess.PIPE)
+    stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+
+    def drain_stderr() -> None:
+        with process.stderr:
+            for line in process.stderr:
+                stderr_tail.append(line.decode(errors="replace").rstrip())
+
+    reader = threading.Thread(target=drain_stderr, name="ffmpeg-stderr", daemon=True)
+    reader.start()
+    return process, reader, stderr_tail
 
 
 def get_video_info(video_path: str) -> dict:
@@ -137,6 +364,23 @@ def get_video_info(video_path: str) -> dict:
     Raises:
         VideoCompressionError: If ffprobe fails
     """
+    try:
+        stat = os.stat(video_path)
+    except OSError as e:
+        raise VideoCompressionError(f"Failed to get video info: {str(e)}")
+
+    # Copy so callers can't mutate the cached entry
+    return dict(_probe_video_info(video_path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=256)
+def _probe_video_info(video_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Run ffprobe for get_video_info.
+
+    mtime_ns and size are only part of the cache key, so a rewritten file
+    gets probed again. Failures raise and are never cached.
+    """
     try:
         cmd = [
             "ffprobe",
@@ -170,7 +414,7 @@ def get_video_info(video_path: str) -> dict:
             'height': video_stream.get('height'),
             'codec': video_stream.get('codec_name'),
             'bitrate': int(data.get('format', {}).get('bit_rate', 0)),
-            'fps': eval(video_stream.get('r_frame_rate', '0/1'))  # e.g., "30/1" → 30.0
+            'fps': _parse_rate(video_stream.get('r_frame_rate', '0/1'))  # e.g., "30/1" → 30.0
         }
 
         return info
@@ -181,6 +425,13 @@ def get_video_info(video_path: str) -> dict:
         raise VideoCompressionError(f"Failed to get video info: {str(e)}")
 
 
+def _parse_rate(rate: str) -> float:
+    """Parse an ffprobe rational like "30000/1001" into a float (0.0 if undefined)."""
+    num, _, den = rate.partition('/')
+    denominator = int(den or 1)
+    return int(num) / denominator if denominator else 0.0
+
+
 def estimate_compressed_size(input_size_bytes: int, crf: int = 26) -> int:
     """
     Estimate compressed file size based on CRF setting.
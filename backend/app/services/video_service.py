@@ -1,10 +1,12 @@
-from datetime import datetime, timedelta
+from datetime import datetime
+from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from loguru import logger
 from app.models import Video, Transcription, VideoStatus, Tag, VideoTag
 from app.services.audio_service import (
-    extract_audio,
+    extract_audio_to_memory,
+    save_audio_file,
     get_video_duration,
     cleanup_audio_file,
     split_audio_into_chunks,
@@ -12,7 +14,7 @@ from app.services.audio_service import (
     AudioExtractionError,
 )
 from app.services.transcription_service import (
-    transcribe_audio,
+    transcribe_audio_async,
     transcribe_audio_chunks,
     TranscriptionError,
 )
@@ -61,6 +63,24 @@ async def _store_tags_for_video(db: AsyncSession, video_id: str, tag_names: list
             logger.info(f"Associated tag '{tag_name}' with video {video_id}")
 
 
+def _notes_summary_fields(notes: dict | None) -> dict:
+    """Summary and list counts stored alongside notes for list views."""
+    if not notes:
+        return {}
+
+    def count(key: str) -> int:
+        value = notes.get(key)
+        return len(value) if isinstance(value, list) else 0
+
+    return {
+        "note_summary": notes.get("summary"),
+        "key_points_count": count("key_points"),
+        "takeaways_count": count("takeaways"),
+        "tags_count": count("tags"),
+        "quotes_count": count("quotes"),
+    }
+
+
 async def process_video(
     video_id: str, max_concurrent: int = 2, chunk_threshold_mb: int = 4
 ) -> None:
@@ -115,34 +135,38 @@ async def process_video(
             # Use local file path for backward compatibility
             video_path = file_path
 
-        # Session 3: Update status to extracting_audio and get duration
+        # Session 3: Update status to extracting_audio
         async with AsyncSessionLocal() as db:
             result = await db.execute(select(Video).filter(Video.id == video_id))
             video = result.scalar_one_or_none()
             if video:
                 video.status = VideoStatus.extracting_audio
-
-                # Get video duration
-                try:
-                    duration = get_video_duration(video_path)
-                    video.duration_seconds = int(duration)
-                    logger.info(f"Video duration: {duration:.2f} seconds")
-                except AudioExtractionError as e:
-                    logger.warning(f"Could not extract video duration: {str(e)}")
-                    # Continue processing even if duration extraction fails
-
                 await db.commit()
 
-        # Extract audio from video (no DB connection needed)
+        # Extract audio from video into memory (no DB connection needed);
+        # ffmpeg reports the source duration in the same run
         logger.info(f"Extracting audio from {video_path}")
-        audio_path, audio_size = extract_audio(video_path)
-        logger.info(f"Audio extracted to {audio_path}, size: {audio_size} bytes")
+        audio_bytes, duration = extract_audio_to_memory(video_path)
+        audio_size = len(audio_bytes)
+        logger.info(f"Audio extracted, size: {audio_size} bytes")
 
-        # Session 4: Update status to transcribing
+        if duration is None:
+            # Fall back to ffprobe when ffmpeg didn't report a duration
+            try:
+                duration = get_video_duration(video_path)
+            except AudioExtractionError as e:
+                logger.warning(f"Could not extract video duration: {str(e)}")
+                # Continue processing even if duration extraction fails
+        if duration is not None:
+            logger.info(f"Video duration: {duration:.2f} seconds")
+
+        # Session 4: Record duration and update status to transcribing
         async with AsyncSessionLocal() as db:
             result = await db.execute(select(Video).filter(Video.id == video_id))
             video = result.scalar_one_or_none()
             if video:
+                if duration is not None:
+                    video.duration_seconds = int(duration)
                 video.status = VideoStatus.transcribing
                 await db.commit()
 
@@ -155,8 +179,10 @@ async def process_video(
             logger.info(
                 f"Audio file {audio_size / (1024*1024):.2f} MB exceeds threshold, splitting into chunks"
             )
-            chunks = split_audio_into_chunks(
-                audio_path, max_chunk_size_mb=chunk_threshold_mb
+            # Chunking runs ffmpeg on a file, so only oversized audio touches disk
+            audio_path = save_audio_file(audio_bytes, Path(video_path).stem)
+            chunks = await split_audio_into_chunks(
+                audio_path, max_chunk_size_mb=chunk_threshold_mb, total_duration=duration
             )
             logger.info(
                 f"Transcribing {len(chunks)} chunks with max {max_concurrent} concurrent requests"
@@ -165,9 +191,9 @@ async def process_video(
                 chunks, max_concurrent=max_concurrent
             )
         else:
-            # Small audio file - transcribe directly
-            logger.info(f"Transcribing audio {audio_path}")
-            transcript_text, model_used, transcript_segments = transcribe_audio(audio_path)
+            # Small audio file - transcribe directly from memory
+            logger.info(f"Transcribing {audio_size} bytes of audio")
+            transcript_text, model_used, transcript_segments = await transcribe_audio_async(audio_bytes)
 
         transcription_time = datetime.now() - transcription_start
         logger.info(f"Transcription complete, {len(transcript_text)} characters, {len(transcript_segments) if transcript_segments else 0} segments")
@@ -231,6 +257,7 @@ async def process_video(
                 audio_size=audio_size,
                 transcript_segments=transcript_segments,
                 notes=notes_dict,
+                **_notes_summary_fields(notes_dict),
             )
             db.add(transcription)
 
@@ -10,6 +10,12 @@ import yt_dlp
 from app.config import settings
 
 
+# YouTube video ID: 11 characters (alphanumeric, dash, underscore)
+_YT_ID_RE = re.compile(r'[a-zA-Z0-9_-]{11}')
+# ID after "v=" (watch URLs) or "/" (youtu.be/ID, /embed/ID, /shorts/ID)
+_YT_URL_ID_RE = re.compile(r'(?:v=|/)([a-zA-Z0-9_-]{11})')
+
+
 class YouTubeDownloadError(Exception):
     """Exception raised when YouTube video download fails."""
     pass
@@ -33,22 +39,14 @@ def extract_video_id(url_or_id: str) -> str:
     Raises:
         YouTubeDownloadError: If URL format is invalid
     """
-    # Pattern for YouTube video ID (11 characters: alphanumeric, dash, underscore)
-    video_id_pattern = r'^[a-zA-Z0-9_-]{11}$'
-
     # If it's already a video ID
-    if re.match(video_id_pattern, url_or_id):
+    if _YT_ID_RE.fullmatch(url_or_id):
         return url_or_id
 
-    # Extract from youtube.com/watch?v=ID
-    watch_match = re.search(r'(?:v=|/)([a-zA-Z0-9_-]{11})', url_or_id)
-    if watch_match:
-        return watch_match.group(1)
-
-    # Extract from youtu.be/ID
-    short_match = re.search(r'youtu\.be/([a-zA-Z0-9_-]{11})', url_or_id)
-    if short_match:
-        return short_match.group(1)
+    # Extract from youtube.com/watch?v=ID or youtu.be/ID
+    match = _YT_URL_ID_RE.search(url_or_id)
+    if match:
+        return match.group(1)
 
     raise YouTubeDownloadError(
         f"Invalid YouTube URL or video ID format: {url_or_id}. "
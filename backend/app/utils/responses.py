@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core's Rust encoder instead of json.dumps.
+
+    Produces compact UTF-8 JSON and natively handles datetime, UUID, enum and
+    timedelta values, so large payloads (transcript segments, notes) are
+    encoded without a pure-Python pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,84 @@
+"""Scratch directory selection for short-lived media intermediates."""
+import os
+import shutil
+from typing import Optional
+
+from loguru import logger
+
+from app.config import settings
+
+
+def get_scratch_dir(required_bytes: int = 0) -> Optional[str]:
+    """
+    Pick a directory for temp media files, preferring RAM-backed storage.
+
+    Args:
+        required_bytes: Free space the caller expects to need
+
+    Returns:
+        The configured scratch dir if it is usable and has room, otherwise
+        None so tempfile falls back to the system default
+    """
+    scratch_dir = settings.scratch_dir
+    if not scratch_dir or not os.access(scratch_dir, os.W_OK):
+        return None
+
+    try:
+        free_bytes = shutil.disk_usage(scratch_dir).free
+    except OSError:
+        return None
+
+    headroom = settings.scratch_min_free_mb * 1024 * 1024
+    if free_bytes < required_bytes + headroom:
+        return None
+
+    return scratch_dir
+
+
+def is_tmpfs(path: str) -> bool:
+    """
+    Check whether a path lives on a tmpfs mount.
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        True if the longest matching mount point in /proc/mounts is tmpfs
+    """
+    real_path = os.path.realpath(path)
+    best_match, best_fstype = "", None
+
+    try:
+        with open("/proc/mounts") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point, fstype = fields[1], fields[2]
+                if (
+                    real_path == mount_point
+                    or real_path.startswith(mount_point.rstrip("/") + "/")
+                ) and len(mount_point) > len(best_match):
+                    best_match, best_fstype = mount_point, fstype
+    except OSError:
+        return False
+
+    return best_fstype == "tmpfs"
+
+
+def check_scratch_dir() -> None:
+    """Log at startup whether the scratch dir is usable and RAM-backed."""
+    scratch_dir = settings.scratch_dir
+    if not scratch_dir:
+        return
+
+    if get_scratch_dir() is None:
+        logger.warning(
+            f"Scratch dir {scratch_dir} is unavailable or too small; "
+            "falling back to the system temp dir"
+        )
+    elif not is_tmpfs(scratch_dir):
+        logger.warning(f"Scratch dir {scratch_dir} is not tmpfs; temp media will hit disk")
+    else:
+        free_mb = shutil.disk_usage(scratch_dir).free // (1024 * 1024)
+        logger.info(f"Using tmpfs scratch dir {scratch_dir} ({free_mb} MB free)")
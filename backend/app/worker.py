@@ -3,27 +3,43 @@
 This is a separate FastAPI application that handles CPU-intensive video processing
 triggered by Google Cloud Tasks. It runs as a separate Cloud Run service.
 """
+from contextlib import aclosing, asynccontextmanager
+from pathlib import Path
 from fastapi import FastAPI, HTTPException, Request
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 from uuid import UUID
-import asyncio
 from loguru import logger
 
 from app.database import AsyncSessionLocal
 from app.models import Video, Transcription, VideoStatus
-from app.services.video_compression_service import compress_video, VideoCompressionError
-from app.services.r2_service import upload_local_file, download_video, delete_video, R2Error
+from app.services.video_compression_service import compress_video_stream, VideoCompressionError
+from app.services.r2_service import (
+    build_video_key,
+    upload_local_file,
+    upload_stream,
+    download_video,
+    delete_video,
+    R2Error
+)
 from app.services.video_service import process_video
 from app.config import settings
 from app.utils.file_handler import delete_file
+from app.utils.scratch import check_scratch_dir
 from sqlalchemy import select
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_scratch_dir()
+    yield
+
+
 # Create worker FastAPI app
 app = FastAPI(
     title="Notetaker Worker Service",
     description="Background video processing service",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
@@ -82,7 +98,6 @@ async def process_video_task(task: VideoProcessingTask, request: Request):
 
     async with AsyncSessionLocal() as db:
         local_file_path = None
-        compressed_path = None
 
         try:
             # Get video record
@@ -115,14 +130,12 @@ async def process_video_task(task: VideoProcessingTask, request: Request):
             logger.info(f"[Worker] Downloading video from R2: {r2_key}")
 
             # Download video from R2
-            local_file_path, _ = download_video(r2_key)
-            original_size = len(open(local_file_path, 'rb').read())
+            local_file_path, original_size = download_video(r2_key)
 
             logger.info(f"[Worker] Downloaded {original_size / (1024*1024):.2f}MB")
 
             # Compress video if enabled
-            upload_path = local_file_path
-            upload_size = original_size
+            final_r2_key = None
 
             # Check if file is too large to compress (skip for very large files)
             skip_compression = original_size > (settings.compression_skip_threshold_mb * 1024 * 1024)
@@ -137,40 +150,43 @@ async def process_video_task(task: VideoProcessingTask, request: Request):
                 try:
                     logger.info(f"[Worker] Compressing video (CRF={settings.compression_crf})...")
 
-                    # Run compression in thread pool to avoid blocking
-                    loop = asyncio.get_event_loop()
-                    compressed_path, compressed_size = await loop.run_in_executor(
-                        None,
-                        compress_video,
+                    # Upload parts to R2 while FFmpeg is still encoding; nothing hits disk
+                    compressed_key = build_video_key(f"{Path(local_file_path).stem}.mp4", user_id)
+                    chunks = compress_video_stream(
                         local_file_path,
-                        None,  # output_path (auto-generated)
                         settings.compression_crf,
                         (settings.compression_max_width, settings.compression_max_height),
                         settings.compression_max_fps,
                         settings.compression_audio_bitrate,
-                        settings.compression_preset
+                        settings.compression_preset,
+                        settings.compression_hw_accel
                     )
+                    async with aclosing(chunks):
+                        file_size = await upload_stream(
+                            chunks,
+                            compressed_key,
+                            Path(local_file_path).name
+                        )
+                    final_r2_key = compressed_key
 
-                    reduction_pct = ((original_size - compressed_size) / original_size) * 100
+                    reduction_pct = ((original_size - file_size) / original_size) * 100
                     logger.info(
                         f"[Worker] Compression complete: {original_size / (1024*1024):.2f}MB → "
-                        f"{compressed_size / (1024*1024):.2f}MB ({reduction_pct:.1f}% reduction)"
+                        f"{file_size / (1024*1024):.2f}MB ({reduction_pct:.1f}% reduction)"
                     )
 
-                    upload_path = compressed_path
-                    upload_size = compressed_size
-
                 except VideoCompressionError as e:
                     logger.warning(f"[Worker] Compression failed, using original: {str(e)}")
                     # Continue with original file
 
-            # Re-upload compressed video to R2
-            logger.info(f"[Worker] Uploading processed video to R2...")
-            final_r2_key, file_size = upload_local_file(
-                upload_path,
-                user_id=user_id,
-                content_type="video/mp4"
-            )
+            if final_r2_key is None:
+                # Re-upload original video to R2
+                logger.info(f"[Worker] Uploading original video to R2...")
+                final_r2_key, file_size = upload_local_file(
+                    local_file_path,
+                    user_id=user_id,
+                    content_type="video/mp4"
+                )
 
             logger.info(f"[Worker] Uploaded to R2: {final_r2_key}")
 
@@ -247,8 +263,6 @@ async def process_video_task(task: VideoProcessingTask, request: Request):
             # Clean up temp files
             if local_file_path:
                 delete_file(local_file_path)
-            if compressed_path:
-                delete_file(compressed_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""
+Bulk-seed collections for a user using the PostgreSQL COPY protocol.
+
+Loads all rows in a single COPY through asyncpg instead of one
+INSERT + COMMIT per collection, which makes large fixtures practical.
+
+Usage:
+    cd backend
+    uv run --env-file .env python scripts/seed_collections.py <user_uuid> [count]
+
+Example:
+    uv run --env-file .env python scripts/seed_collections.py 550e8400-e29b-41d4-a716-446655440000 5000
+"""
+
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.database import engine
+from loguru import logger
+
+DEFAULT_COUNT = 1000
+
+
+async def seed_collections(user_id: uuid.UUID, count: int) -> int:
+    """Insert `count` collections owned by `user_id` with a single COPY."""
+    records = [
+        (uuid.uuid4(), f"Seed collection {i:05d}", f"Seeded collection #{i}", user_id)
+        for i in range(1, count + 1)
+    ]
+
+    async with engine.begin() as conn:
+        # COPY is not exposed through SQLAlchemy; drop to the asyncpg connection.
+        # It still runs inside the transaction opened by engine.begin().
+        raw_connection = await conn.get_raw_connection()
+        asyncpg_connection = raw_connection.driver_connection
+        await asyncpg_connection.copy_records_to_table(
+            "collections",
+            records=records,
+            columns=["id", "name", "description", "user_id"],
+        )
+
+    await engine.dispose()
+    return len(records)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: uv run python scripts/seed_collections.py <user_uuid> [count]")
+        sys.exit(1)
+
+    try:
+        seed_user_id = uuid.UUID(sys.argv[1])
+    except ValueError:
+        print("❌ Error: User ID must be a valid UUID")
+        sys.exit(1)
+
+    seed_count = int(sys.argv[2]) if len(sys.argv) == 3 else DEFAULT_COUNT
+
+    inserted = asyncio.run(seed_collections(seed_user_id, seed_count))
+    logger.info(f"✅ Seeded {inserted} collections for user {seed_user_id}")
@@ -45,7 +45,7 @@ def test_audio_size(video_path):
     audio_path = None
     try:
         print(f"\n🎵 Extracting audio with 64k bitrate...")
-        audio_path, audio_size = extract_audio(video_path)
+        audio_path, audio_size, _ = extract_audio(video_path)
 
         print(f"\n✅ Audio Extraction Successful!")
         print(f"   Path: {audio_path}")
@@ -64,7 +64,7 @@ async def test_chunked_transcription(video_path, force_chunking=False):
     try:
         # Step 1: Extract audio
         print(f"\n🎵 Step 1: Extracting compressed audio...")
-        audio_path, audio_size = extract_audio(video_path)
+        audio_path, audio_size, _ = extract_audio(video_path)
         extraction_time = (datetime.now() - start_time).total_seconds()
 
         print(f"   ✅ Extracted in {extraction_time:.1f}s")
@@ -81,7 +81,7 @@ async def test_chunked_transcription(video_path, force_chunking=False):
             chunk_start = datetime.now()
             # Force smaller chunks for testing
             max_chunk_size = 10 if force_chunking else 20
-            chunks = split_audio_into_chunks(audio_path, max_chunk_size_mb=max_chunk_size)
+            chunks = await split_audio_into_chunks(audio_path, max_chunk_size_mb=max_chunk_size)
             chunk_time = (datetime.now() - chunk_start).total_seconds()
 
             print(f"   ✅ Split into {len(chunks)} chunks in {chunk_time:.1f}s")
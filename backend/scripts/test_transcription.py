@@ -72,7 +72,7 @@ async def test_transcription_pipeline(video_path):
         # Step 1: Extract compressed audio
         print(f"\n🎵 Step 1: Extracting compressed audio...")
         print(f"   Settings: Mono, 16 kHz, 32 kbps")
-        audio_path, audio_size = extract_audio(video_path)
+        audio_path, audio_size, _ = extract_audio(video_path)
 
         extraction_time = (datetime.now() - start_time).total_seconds()
         print(f"   ✅ Audio extracted in {extraction_time:.1f}s")
@@ -98,7 +98,7 @@ async def test_transcription_pipeline(video_path):
             print(
                 f"   Audio file {audio_size / (1024*1024):.2f} MB exceeds threshold, splitting into chunks"
             )
-            chunks = split_audio_into_chunks(
+            chunks = await split_audio_into_chunks(
                 audio_path, max_chunk_size_mb=CHUNK_THRESHOLD_MB
             )
             print(f"   Created {len(chunks)} chunks")
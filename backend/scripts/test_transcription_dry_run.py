@@ -49,7 +49,7 @@ def test_setup_dry_run(video_path):
         # Extract audio
         print(f"\n🎵 Extracting compressed audio...")
         print(f"   Format: Mono, 16 kHz, 32 kbps MP3")
-        audio_path, audio_size = extract_audio(video_path)
+        audio_path, audio_size, _ = extract_audio(video_path)
 
         print(f"\n✅ Audio extracted:")
         print(f"   Size: {format_bytes(audio_size)}")